@@ -1,21 +1,44 @@
-import json
+import mmap
+import os
 import pathlib
 import sys
+import threading
+from types import MappingProxyType
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the stdlib
+    orjson = None
+    import json
 
 CONFIG_PATH = pathlib.Path(__file__).parent.parent / "config.json"
 
+# Deferred saves are coalesced into one disk write after this delay.
+SAVE_DELAY_S = 0.5
+
 BAUD_RATES = [300, 1200, 2400, 4800, 9600, 19200, 38400, 57600,
               115200, 230400, 460800, 921600]
 
 PARITIES = {"None": "N", "Even": "E", "Odd": "O", "Mark": "M", "Space": "S"}
-PARITIES_INV = {v: k for k, v in PARITIES.items()}
+PARITIES_INV = MappingProxyType({v: k for k, v in PARITIES.items()})
 
 STOPBITS = {"1": 1, "1.5": 1.5, "2": 2}
-STOPBITS_INV = {v: k for k, v in STOPBITS.items()}
+STOPBITS_INV = MappingProxyType({v: k for k, v in STOPBITS.items()})
 
-LINE_ENDINGS = {"None": b"", "CR": b"\r", "LF": b"\n", "CRLF": b"\r\n"}
+# Read-only: looked up on every send, never mutated at runtime.
+LINE_ENDINGS = MappingProxyType(
+    {"None": b"", "CR": b"\r", "LF": b"\n", "CRLF": b"\r\n"}
+)
+get_line_ending_bytes = LINE_ENDINGS.get
 
-DEFAULTS: dict = {
+# Combobox value lists, built once rather than per widget construction
+BAUD_RATE_STRS = tuple(map(str, BAUD_RATES))
+PARITY_KEYS = tuple(PARITIES)
+STOPBITS_KEYS = tuple(STOPBITS)
+LINE_ENDING_KEYS = tuple(LINE_ENDINGS)
+
+_DEFAULTS = {
     "port": "",
     "baud": 115200,
     "parity": "N",
@@ -34,38 +57,135 @@ DEFAULTS: dict = {
     "tests": [],
     "trigger_port": "",
     "trigger_baud": 9600,
+    "modal_errors": False,
+    "terminal_overload_mode": True,
+    "terminal_wrap": "word",     # "word" | "char" | "none" — cheapest last
+    "virtual_terminal": False,   # draw only visible lines (no wrap / selection)
+    "results_log_max_lines": 5000,
 }
+# Read-only view; AppConfig.load() works on a copy.
+DEFAULTS = MappingProxyType(_DEFAULTS)
+
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw).decode("utf-8"))
+
+
+def _read_config(path: pathlib.Path):
+    # Map the file instead of read()-ing it so the parser works on the page
+    # cache directly rather than a private copy of the contents.
+    with open(path, "rb") as fh:
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def _dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+# Serialised once so saving an all-defaults config needs no encoding step.
+_DEFAULTS_BYTES = _dumps(_DEFAULTS)
 
 
 class AppConfig:
     def __init__(self, data: dict) -> None:
         self._data = data
+        # Guards _data against the deferred-save timer thread.
+        self._lock = threading.Lock()
+        # Held for a whole flush, snapshot through os.replace: a timer flush
+        # and an immediate save never interleave on the temp file, and the
+        # later snapshot is always the one left on disk.  Taken before _lock.
+        self._write_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        # Keys whose value changed since the last successful write
+        self._dirty_keys: set = set()
+        self._last_bytes: Optional[bytes] = None
 
     @classmethod
     def load(cls) -> "AppConfig":
-        data = dict(DEFAULTS)
+        data = DEFAULTS.copy()
         try:
-            raw = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            raw = _read_config(CONFIG_PATH)
             if isinstance(raw, dict):
                 data.update(raw)
         except Exception:
             pass
         return cls(data)
 
-    def save(self) -> None:
+    def save(self, *, immediate: bool = False) -> None:
+        """Persist the config to disk.
+
+        By default the write is deferred by ``SAVE_DELAY_S`` so that several
+        mutations in quick succession result in a single disk write.  Pass
+        ``immediate=True`` (e.g. on shutdown) to write synchronously; it also
+        waits for a timer flush that is already writing.
+        Nothing is serialised when no key has changed since the last write.
+        """
+        with self._lock:
+            if not self._dirty_keys and not immediate:
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not immediate:
+                self._save_timer = threading.Timer(SAVE_DELAY_S, self._flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+                return
+        self._flush()
+
+    def _flush(self) -> None:
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        with self._lock:
+            # Only forget the timer running this flush: a newer one started
+            # by save() meanwhile must stay cancellable
+            if self._save_timer is threading.current_thread():
+                self._save_timer = None
+            if not self._dirty_keys:
+                return
+            dirty_keys = self._dirty_keys
+            self._dirty_keys = set()
+            try:
+                if self._data == DEFAULTS:
+                    payload = _DEFAULTS_BYTES
+                else:
+                    payload = _dumps(self._data)
+            except Exception as exc:
+                self._dirty_keys |= dirty_keys
+                print(f"[config] save failed: {exc}", file=sys.stderr)
+                return
+        # Skip the write entirely when nothing has changed since the last save
+        if payload == self._last_bytes:
+            return
+        # Write to a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated config.json behind.
+        tmp = CONFIG_PATH.with_suffix(CONFIG_PATH.suffix + ".tmp")
         try:
-            CONFIG_PATH.write_text(
-                json.dumps(self._data, indent=2),
-                encoding="utf-8",
-            )
+            tmp.write_bytes(payload)
+            os.replace(tmp, CONFIG_PATH)
+            self._last_bytes = payload
         except Exception as exc:
+            with self._lock:
+                self._dirty_keys |= dirty_keys
             print(f"[config] save failed: {exc}", file=sys.stderr)
 
     def __getitem__(self, key):
         return self._data[key]
 
     def __setitem__(self, key, value) -> None:
-        self._data[key] = value
+        with self._lock:
+            if key in self._data and self._data[key] == value:
+                return
+            self._data[key] = value
+            self._dirty_keys.add(key)
 
     def get(self, key, default=None):
         return self._data.get(key, default)
@@ -1,7 +1,8 @@
 import collections
+import functools
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 
 class CommandPanel(ttk.Frame):
@@ -11,6 +12,9 @@ class CommandPanel(ttk.Frame):
         self._history: collections.deque = collections.deque(
             maxlen=config.get("history_size", 100)
         )
+        # List copy of _history for Up/Down navigation (deque indexing is O(n));
+        # rebuilt lazily and dropped whenever a new command is appended.
+        self._history_list: Optional[List[str]] = None
         self._history_idx: int = -1
         self._pending_input: str = ""
 
@@ -27,11 +31,11 @@ class CommandPanel(ttk.Frame):
         self._entry_var = tk.StringVar()
         self._entry = ttk.Entry(self, textvariable=self._entry_var)
         self._entry.grid(row=0, column=1, padx=2, pady=4, sticky="ew")
-        self._entry.bind("<Return>", lambda _: self._send_command())
-        self._entry.bind("<Up>", lambda _: self._history_prev())
-        self._entry.bind("<Down>", lambda _: self._history_next())
-        self._entry.bind("<Escape>", lambda _: self._entry_var.set(""))
-        self._entry.bind("<Control-a>", lambda _: self._entry.selection_range(0, "end"))
+        self._entry.bind("<Return>", self._send_command)
+        self._entry.bind("<Up>", self._history_prev)
+        self._entry.bind("<Down>", self._history_next)
+        self._entry.bind("<Escape>", self._clear_entry)
+        self._entry.bind("<Control-a>", self._select_all)
 
         self._send_btn = ttk.Button(self, text="Send", command=self._send_command, width=8)
         self._send_btn.grid(row=0, column=2, padx=(2, 4), pady=4)
@@ -42,7 +46,7 @@ class CommandPanel(ttk.Frame):
         self._special_btns = []
         for col, (label, char) in enumerate(_special, start=4):
             btn = ttk.Button(self, text=label, width=4,
-                             command=lambda c=char: self._send_special(c))
+                             command=functools.partial(self._send_special, char))
             btn.grid(row=0, column=col, padx=2, pady=4)
             self._special_btns.append(btn)
 
@@ -55,12 +59,19 @@ class CommandPanel(ttk.Frame):
         if self.on_send and self._line_ending_provider:
             self.on_send(char, b"")
 
-    def _send_command(self) -> None:
+    def _clear_entry(self, *_) -> None:
+        self._entry_var.set("")
+
+    def _select_all(self, *_) -> None:
+        self._entry.selection_range(0, "end")
+
+    def _send_command(self, *_) -> None:
         text = self._entry_var.get()
         if not text:
             return
         if not self._history or self._history[-1] != text:
             self._history.append(text)
+            self._history_list = None
         self._history_idx = -1
         self._pending_input = ""
         self._entry_var.set("")
@@ -68,26 +79,33 @@ class CommandPanel(ttk.Frame):
         if self.on_send and self._line_ending_provider:
             self.on_send(text, self._line_ending_provider())
 
-    def _history_prev(self) -> None:
+    def _history_snapshot(self) -> List[str]:
+        if self._history_list is None:
+            self._history_list = list(self._history)
+        return self._history_list
+
+    def _history_prev(self, *_) -> None:
         if not self._history:
             return
+        history = self._history_snapshot()
         if self._history_idx == -1:
             self._pending_input = self._entry_var.get()
-            self._history_idx = len(self._history) - 1
+            self._history_idx = len(history) - 1
         elif self._history_idx > 0:
             self._history_idx -= 1
-        self._entry_var.set(self._history[self._history_idx])
+        self._entry_var.set(history[self._history_idx])
         self._entry.icursor("end")
 
-    def _history_next(self) -> None:
+    def _history_next(self, *_) -> None:
         if self._history_idx == -1:
             return
+        history = self._history_snapshot()
         self._history_idx += 1
-        if self._history_idx >= len(self._history):
+        if self._history_idx >= len(history):
             self._history_idx = -1
             self._entry_var.set(self._pending_input)
         else:
-            self._entry_var.set(self._history[self._history_idx])
+            self._entry_var.set(history[self._history_idx])
         self._entry.icursor("end")
 
     def set_enabled(self, enabled: bool) -> None:
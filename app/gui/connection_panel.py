@@ -1,12 +1,21 @@
+import functools
 import pathlib
 import tkinter as tk
 from tkinter import filedialog, ttk
 from typing import Callable, Optional
 
-from app.config import BAUD_RATES, LINE_ENDINGS, PARITIES, STOPBITS, AppConfig
+from app.config import (
+    BAUD_RATE_STRS, LINE_ENDING_KEYS, PARITIES, PARITIES_INV, PARITY_KEYS,
+    STOPBITS, STOPBITS_INV, STOPBITS_KEYS, AppConfig, get_line_ending_bytes,
+)
 from app.serial_handler import list_serial_ports
 
 
+@functools.lru_cache(maxsize=64)
+def _port_display(dev: str, desc: str) -> str:
+    return f"{dev} — {desc}" if desc != dev else dev
+
+
 class ConnectionPanel(ttk.LabelFrame):
     def __init__(self, parent, config: AppConfig, **kwargs):
         super().__init__(parent, text="Connection", **kwargs)
@@ -15,17 +24,11 @@ class ConnectionPanel(ttk.LabelFrame):
         self.on_connect: Optional[Callable[[dict], None]] = None
         self.on_disconnect: Optional[Callable[[], None]] = None
 
-        self._port_var = tk.StringVar()
-        self._baud_var = tk.StringVar(value=str(config.get("baud", 115200)))
-        self._parity_var = tk.StringVar()
-        self._databits_var = tk.StringVar(value=str(config.get("databits", 8)))
-        self._stopbits_var = tk.StringVar()
-        self._line_ending_var = tk.StringVar(value=config.get("line_ending", "CRLF"))
-
         self._log_dir_var = tk.StringVar(value=config.get("log_dir", ""))
 
         self._connected = False
         self._port_map: dict = {}  # display string → device name
+        self._device_to_display: dict = {}  # device name → display string
 
         self._setup_ui()
         self._restore_from_config()
@@ -36,7 +39,7 @@ class ConnectionPanel(ttk.LabelFrame):
 
         # Row 0: Port + Baud
         ttk.Label(self, text="Port:").grid(row=0, column=0, sticky="e", **pad)
-        self._port_cb = ttk.Combobox(self, textvariable=self._port_var, width=24)
+        self._port_cb = ttk.Combobox(self, width=24)
         self._port_cb.grid(row=0, column=1, sticky="ew", **pad)
 
         self._refresh_btn = ttk.Button(self, text="⟳", width=3, command=self._refresh_ports)
@@ -45,8 +48,7 @@ class ConnectionPanel(ttk.LabelFrame):
         ttk.Label(self, text="Baud:").grid(row=0, column=3, sticky="e", **pad)
         self._baud_cb = ttk.Combobox(
             self,
-            textvariable=self._baud_var,
-            values=[str(b) for b in BAUD_RATES],
+            values=BAUD_RATE_STRS,
             state="readonly",
             width=10,
         )
@@ -56,8 +58,7 @@ class ConnectionPanel(ttk.LabelFrame):
         ttk.Label(self, text="Parity:").grid(row=1, column=0, sticky="e", **pad)
         self._parity_cb = ttk.Combobox(
             self,
-            textvariable=self._parity_var,
-            values=list(PARITIES.keys()),
+            values=PARITY_KEYS,
             state="readonly",
             width=8,
         )
@@ -66,7 +67,6 @@ class ConnectionPanel(ttk.LabelFrame):
         ttk.Label(self, text="Data bits:").grid(row=1, column=3, sticky="e", **pad)
         self._databits_cb = ttk.Combobox(
             self,
-            textvariable=self._databits_var,
             values=["5", "6", "7", "8"],
             state="readonly",
             width=4,
@@ -76,8 +76,7 @@ class ConnectionPanel(ttk.LabelFrame):
         ttk.Label(self, text="Stop bits:").grid(row=1, column=5, sticky="e", **pad)
         self._stopbits_cb = ttk.Combobox(
             self,
-            textvariable=self._stopbits_var,
-            values=list(STOPBITS.keys()),
+            values=STOPBITS_KEYS,
             state="readonly",
             width=4,
         )
@@ -86,8 +85,7 @@ class ConnectionPanel(ttk.LabelFrame):
         ttk.Label(self, text="Line ending:").grid(row=1, column=7, sticky="e", **pad)
         self._le_cb = ttk.Combobox(
             self,
-            textvariable=self._line_ending_var,
-            values=list(LINE_ENDINGS.keys()),
+            values=LINE_ENDING_KEYS,
             state="readonly",
             width=6,
         )
@@ -121,35 +119,39 @@ class ConnectionPanel(ttk.LabelFrame):
         self._config.save()
 
     def _restore_from_config(self) -> None:
-        from app.config import PARITIES_INV, STOPBITS_INV
+        self._baud_cb.set(str(self._config.get("baud", 115200)))
+        self._databits_cb.set(str(self._config.get("databits", 8)))
+        self._le_cb.set(self._config.get("line_ending", "CRLF"))
 
         saved_parity = self._config.get("parity", "N")
-        self._parity_var.set(PARITIES_INV.get(saved_parity, "None"))
+        self._parity_cb.set(PARITIES_INV.get(saved_parity, "None"))
 
         saved_stopbits = self._config.get("stopbits", 1)
-        self._stopbits_var.set(STOPBITS_INV.get(saved_stopbits, "1"))
+        self._stopbits_cb.set(STOPBITS_INV.get(saved_stopbits, "1"))
 
     def _refresh_ports(self) -> None:
         ports = list_serial_ports()
         self._port_map = {}
+        self._device_to_display = {}
         if ports:
             displays = []
             for dev, desc in ports:
-                display = f"{dev} — {desc}" if desc != dev else dev
+                display = _port_display(dev, desc)
                 self._port_map[display] = dev
+                self._device_to_display[dev] = display
                 displays.append(display)
             self._port_cb["values"] = displays
 
             saved = self._config.get("port", "")
-            match = next((d for d, v in self._port_map.items() if v == saved), None)
+            match = self._device_to_display.get(saved)
             if match:
-                self._port_var.set(match)
+                self._port_cb.set(match)
             else:
-                self._port_var.set(displays[0])
+                self._port_cb.set(displays[0])
             self._connect_btn.config(state="normal")
         else:
             self._port_cb["values"] = ["(no ports found)"]
-            self._port_var.set("(no ports found)")
+            self._port_cb.set("(no ports found)")
             self._connect_btn.config(state="disabled")
 
     def _on_connect_click(self) -> None:
@@ -161,21 +163,21 @@ class ConnectionPanel(ttk.LabelFrame):
                 self.on_connect(self.get_params())
 
     def get_params(self) -> dict:
-        display = self._port_var.get()
+        display = self._port_cb.get()
         port = self._port_map.get(display, display.split(" — ")[0].strip())
         return {
             "port": port,
-            "baud": int(self._baud_var.get()),
-            "parity": PARITIES.get(self._parity_var.get(), "N"),
-            "databits": int(self._databits_var.get()),
-            "stopbits": STOPBITS.get(self._stopbits_var.get(), 1),
+            "baud": int(self._baud_cb.get()),
+            "parity": PARITIES.get(self._parity_cb.get(), "N"),
+            "databits": int(self._databits_cb.get()),
+            "stopbits": STOPBITS.get(self._stopbits_cb.get(), 1),
         }
 
     def get_line_ending(self) -> bytes:
-        return LINE_ENDINGS.get(self._line_ending_var.get(), b"\r\n")
+        return get_line_ending_bytes(self._le_cb.get(), b"\r\n")
 
     def get_line_ending_key(self) -> str:
-        return self._line_ending_var.get()
+        return self._le_cb.get()
 
     def set_connected(self, connected: bool) -> None:
         self._connected = connected
@@ -1,6 +1,6 @@
-import queue
+import collections
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import ttk
 
 from app.config import AppConfig
 from app.logger import SessionLogger
@@ -10,7 +10,18 @@ from app.gui.terminal_panel import TerminalPanel
 from app.gui.command_panel import CommandPanel
 from app.gui.test_suite_panel import TestSuitePanel
 
-_POLL_MAX = 200  # max messages drained per poll tick
+# Adaptive poll timing: a tick that hits _POLL_MAX reschedules via after_idle
+# so the backlog drains as fast as Tk allows; empty ticks back off
+# exponentially from poll_interval_ms up to _POLL_IDLE_MS.
+_POLL_MAX = 200             # max messages drained per poll tick
+_POLL_IDLE_MS = 100
+
+# Overload: after this many consecutive full ticks the terminal shows only the
+# newest _OVERLOAD_DISPLAY lines of each tick (the session log still gets all).
+_OVERLOAD_TICKS = 3
+_OVERLOAD_DISPLAY = 50
+
+_STATUS_ERROR_MS = 5000     # how long a transient error stays in the status bar
 
 
 class MainWindow:
@@ -19,6 +30,16 @@ class MainWindow:
         self._config = config
         self._handler = SerialHandler()
         self._logger = SessionLogger()
+        self._status_after_id = None
+        self._poll_interval: int = config.get("poll_interval_ms", 50)
+        self._idle_interval: int = self._poll_interval
+        self._overload_enabled: bool = config.get("terminal_overload_mode", True)
+        self._full_ticks = 0        # consecutive ticks that hit _POLL_MAX
+        # Messages received while the Terminal tab is hidden; flushed on reselect
+        self._terminal_visible = True
+        self._terminal_pending: collections.deque = collections.deque(
+            maxlen=config.get("max_lines", 5000)
+        )
 
         self._setup_window()
         self._create_widgets()
@@ -51,6 +72,8 @@ class MainWindow:
         tab1.columnconfigure(0, weight=1)
         tab1.rowconfigure(0, weight=1)
         self._notebook.add(tab1, text="  Terminal  ")
+        self._terminal_tab = tab1
+        self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self._terminal = TerminalPanel(tab1, self._config)
         self._terminal.grid(row=0, column=0, sticky="nsew")
@@ -103,28 +126,72 @@ class MainWindow:
     # ------------------------------------------------------------------ #
 
     def _start_poll(self) -> None:
-        interval = self._config.get("poll_interval_ms", 50)
-        self.root.after(interval, self._poll_queue)
+        # Register the poll callback with Tcl once; root.after() would create
+        # (and later delete) a fresh Tcl command on every tick.
+        self._poll_cmd = self.root.register(self._poll_queue)
+        self._poll_after_id = self.root.tk.call(
+            "after", self._poll_interval, self._poll_cmd
+        )
 
     def _poll_queue(self) -> None:
-        messages = []
-        try:
-            for _ in range(_POLL_MAX):
-                messages.append(self._handler.rx_queue.get_nowait())
-        except queue.Empty:
-            pass
+        # Sampled before draining: a flag seen here belongs to an ERROR message
+        # that is already queued, so it has been drained once a tick empties
+        # the queue.  Disconnecting earlier would close the session log with
+        # that message and the lines before it still waiting.
+        error_pending = self._handler.error_pending
+        messages = self._handler.rx_queue.drain(_POLL_MAX)
+
+        drained = len(messages)
+        self._full_ticks = self._full_ticks + 1 if drained == _POLL_MAX else 0
 
         if messages:
-            self._terminal.batch_append(messages)
-            for msg in messages:
-                self._logger.write(msg)
-            for msg in messages:
-                if msg.direction == Direction.ERROR:
-                    self._handle_error_disconnect()
-                    break
+            display = messages
+            if self._overload_enabled and self._full_ticks >= _OVERLOAD_TICKS:
+                suppressed = drained - _OVERLOAD_DISPLAY
+                display = [TerminalMessage(
+                    Direction.INFO,
+                    f"… {suppressed} lines suppressed (see session log)",
+                )]
+                display.extend(messages[-_OVERLOAD_DISPLAY:])
+            if self._terminal_visible:
+                self._terminal.batch_append(display)
+            else:
+                self._terminal_pending.extend(display)
+            self._logger.write_many(messages)
+        if error_pending and drained < _POLL_MAX:
+            self._handler.take_error_pending()
+            self._handle_error_disconnect()
+
+        if drained == _POLL_MAX:
+            # Probably more waiting — come straight back once Tk is idle
+            self._idle_interval = self._poll_interval
+            self._poll_after_id = self.root.tk.call("after", "idle", self._poll_cmd)
+            return
+        if drained:
+            self._idle_interval = self._poll_interval
+            interval = self._poll_interval
+        else:
+            interval = self._idle_interval
+            self._idle_interval = min(self._idle_interval * 2, _POLL_IDLE_MS)
+        self._poll_after_id = self.root.tk.call("after", interval, self._poll_cmd)
+
+    def _on_tab_changed(self, _event=None) -> None:
+        self._terminal_visible = (
+            self._notebook.select() == str(self._terminal_tab)
+        )
+        if self._terminal_visible and self._terminal_pending:
+            self._terminal.batch_append(list(self._terminal_pending))
+            self._terminal_pending.clear()
 
-        interval = self._config.get("poll_interval_ms", 50)
-        self.root.after(interval, self._poll_queue)
+    def _kick_poll(self) -> None:
+        """Poll as soon as Tk is idle and reset the idle back-off.
+
+        Called after a send: the TX echo is already queued and a response is
+        likely within the next few ticks, so don't wait out a backed-off timer.
+        """
+        self._idle_interval = self._poll_interval
+        self.root.tk.call("after", "cancel", self._poll_after_id)
+        self._poll_after_id = self.root.tk.call("after", "idle", self._poll_cmd)
 
     # ------------------------------------------------------------------ #
     #  Connect / disconnect
@@ -134,7 +201,11 @@ class MainWindow:
         try:
             self._handler.connect(**params)
         except Exception as exc:
-            messagebox.showerror("Connection Failed", str(exc))
+            if self._config.get("modal_errors", False):
+                from tkinter import messagebox
+                messagebox.showerror("Connection Failed", str(exc))
+            else:
+                self._show_transient_status(f"Connect failed: {exc}")
             return
 
         log_dir = self._config.effective_log_dir()
@@ -151,6 +222,7 @@ class MainWindow:
         self._handler.rx_queue.put(
             TerminalMessage(Direction.INFO, f"Connected — {desc}")
         )
+        self._cancel_transient_status()
         self._status_var.set(f"Connected: {desc}")
         self._update_ui_state(connected=True)
         self._save_connection_settings(params)
@@ -174,6 +246,23 @@ class MainWindow:
         self._log_var.set("")
         self._update_ui_state(connected=False)
 
+    def _show_transient_status(self, text: str) -> None:
+        """Show *text* in the status bar without blocking the poll loop."""
+        self._cancel_transient_status()
+        self._status_var.set(text)
+        self._status_after_id = self.root.after(
+            _STATUS_ERROR_MS, self._clear_transient_status
+        )
+
+    def _clear_transient_status(self) -> None:
+        self._status_after_id = None
+        self._status_var.set("Disconnected")
+
+    def _cancel_transient_status(self) -> None:
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
+            self._status_after_id = None
+
     def _update_ui_state(self, connected: bool) -> None:
         self._conn_panel.set_connected(connected)
         self._cmd_panel.set_enabled(connected)
@@ -199,9 +288,9 @@ class MainWindow:
             self._handler.send(text, line_ending)
             self._handler.rx_queue.put(TerminalMessage(Direction.TX, text))
         except Exception as exc:
-            self._handler.rx_queue.put(
-                TerminalMessage(Direction.ERROR, f"Send failed: {exc}")
-            )
+            # Disconnects from the poll loop once the message has been logged
+            self._handler.queue_error(f"Send failed: {exc}")
+        self._kick_poll()
 
     # ------------------------------------------------------------------ #
     #  Shutdown
@@ -212,5 +301,5 @@ class MainWindow:
         if self._handler.is_connected:
             self._handler.disconnect()
         self._logger.close_session()
-        self._config.save()
+        self._config.save(immediate=True)
         self.root.destroy()
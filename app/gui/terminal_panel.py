@@ -1,8 +1,10 @@
+import collections
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk
-from typing import List
+from typing import List, Optional
 
 from app.serial_handler import Direction, TerminalMessage
+from app.gui.virtual_log_view import VirtualLogView
 
 _TAG_MAP = {
     Direction.TX:    "tx",
@@ -10,6 +12,8 @@ _TAG_MAP = {
     Direction.INFO:  "info",
     Direction.ERROR: "error",
 }
+# Every Direction has a tag, so the hot path can index without a default
+_tag_for = _TAG_MAP.__getitem__
 
 _COLORS = {
     "tx":    "#00BFFF",
@@ -24,6 +28,18 @@ class TerminalPanel(ttk.Frame):
         super().__init__(parent, **kwargs)
         self._config = config
         self._max_lines: int = config.get("max_lines", 5000)
+        # Trim in chunks of ~10 % so the delete cost is amortised over many batches
+        self._trim_slack: int = max(self._max_lines // 10, 1)
+        self._line_count: int = 0   # Text lines currently in the widget
+        self._virtual: bool = config.get("virtual_terminal", False)
+        # Python-side copy of the displayed (line, tag) pairs: used by Save As
+        # so it never reads the Text widget back, and as the backing store of
+        # the virtualised view.  With the Text widget it is trimmed together
+        # with the widget in _trim_lines, so both hold the same lines.
+        self._lines: collections.deque = collections.deque(
+            maxlen=self._max_lines if self._virtual else None
+        )
+        self._view: Optional[VirtualLogView] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -31,30 +47,48 @@ class TerminalPanel(ttk.Frame):
         self.rowconfigure(0, weight=1)
 
         font_size = self._config.get("font_size", 10)
-        self._text = scrolledtext.ScrolledText(
-            self,
-            state="disabled",
-            font=("Courier", font_size),
-            bg="#1C1C1C",
-            fg="#E0E0E0",
-            insertbackground="#E0E0E0",
-            wrap="word",
-            relief="flat",
-        )
-        self._text.grid(row=0, column=0, sticky="nsew")
-
-        for tag, color in _COLORS.items():
-            self._text.tag_configure(tag, foreground=color)
+        if self._virtual:
+            # Draws only the visible rows; scales to very large max_lines
+            self._view = VirtualLogView(
+                self,
+                self._lines,
+                font=("Courier", font_size),
+                colors=_COLORS,
+                bg="#1C1C1C",
+                fg="#E0E0E0",
+            )
+            self._view.grid(row=0, column=0, sticky="nsew")
+        else:
+            self._text = scrolledtext.ScrolledText(
+                self,
+                state="disabled",
+                font=("Courier", font_size),
+                bg="#1C1C1C",
+                fg="#E0E0E0",
+                insertbackground="#E0E0E0",
+                wrap=self._config.get("terminal_wrap", "word"),
+                relief="flat",
+            )
+            self._text.grid(row=0, column=0, sticky="nsew")
+
+            for tag, color in _COLORS.items():
+                self._text.tag_configure(tag, foreground=color)
 
         toolbar = ttk.Frame(self)
         toolbar.grid(row=1, column=0, sticky="ew", pady=(2, 0))
 
-        self._autoscroll_var = tk.BooleanVar(value=self._config.get("autoscroll", True))
+        # Plain-Python mirrors of the toggles so batch_append needs no Tcl reads
+        self._autoscroll: bool = self._config.get("autoscroll", True)
+        self._show_ts: bool = self._config.get("show_timestamp", True)
+
+        self._autoscroll_var = tk.BooleanVar(value=self._autoscroll)
+        self._autoscroll_var.trace_add("write", self._on_autoscroll_changed)
         ttk.Checkbutton(
             toolbar, text="Autoscroll", variable=self._autoscroll_var
         ).pack(side="left", padx=4)
 
-        self._show_ts_var = tk.BooleanVar(value=self._config.get("show_timestamp", True))
+        self._show_ts_var = tk.BooleanVar(value=self._show_ts)
+        self._show_ts_var.trace_add("write", self._on_show_ts_changed)
         ttk.Checkbutton(
             toolbar, text="Timestamps", variable=self._show_ts_var
         ).pack(side="left", padx=4)
@@ -62,32 +96,62 @@ class TerminalPanel(ttk.Frame):
         ttk.Button(toolbar, text="Clear", command=self.clear).pack(side="left", padx=4)
         ttk.Button(toolbar, text="Save As…", command=self.save_to_file).pack(side="left", padx=4)
 
-    def _format_line(self, msg: TerminalMessage) -> str:
-        if self._show_ts_var.get():
-            ts = msg.timestamp.strftime("%H:%M:%S.%f")[:-3]
-            return f"[{ts}] [{msg.direction.value:<5s}] {msg.text}\n"
-        return f"[{msg.direction.value:<5s}] {msg.text}\n"
+    def _on_autoscroll_changed(self, *_) -> None:
+        self._autoscroll = self._autoscroll_var.get()
+
+    def _on_show_ts_changed(self, *_) -> None:
+        self._show_ts = self._show_ts_var.get()
+
+    def _format_line(self, msg: TerminalMessage, show_ts: bool) -> str:
+        return msg.formatted_ts if show_ts else msg.formatted_no_ts
 
     def batch_append(self, messages: List[TerminalMessage]) -> None:
+        if not messages:
+            return
+        show_ts = self._show_ts
+        fmt = self._format_line
+        batch = [(fmt(msg, show_ts), _tag_for(msg.direction)) for msg in messages]
+        if self._view is not None:
+            lines = self._lines
+            len_before = len(lines)
+            lines.extend(batch)
+            self._view.refresh(follow=self._autoscroll,
+                               evicted=len_before + len(batch) - len(lines))
+            return
+        self._lines.extend(batch)
+        # Tk's insert takes interleaved chars/tags pairs, so the whole batch
+        # goes across to Tcl in a single call.
+        args = [part for pair in batch for part in pair]
         self._text.config(state="normal")
-        for msg in messages:
-            tag = _TAG_MAP.get(msg.direction, "rx")
-            self._text.insert("end", self._format_line(msg), tag)
+        self._text.insert("end", *args)
+        # Counted from the text, not per message: INFO/ERROR text built from
+        # an exception can span several lines, and each one must be trimmed
+        self._line_count += sum(line.count("\n") for line, _tag in batch)
         self._trim_lines()
         self._text.config(state="disabled")
-        if self._autoscroll_var.get():
-            self._text.see("end")
+        if self._autoscroll:
+            self._text.yview_moveto(1.0)
 
     def _trim_lines(self) -> None:
-        line_count = int(self._text.index("end-1c").split(".")[0])
-        if line_count > self._max_lines:
-            excess = line_count - self._max_lines
-            self._text.delete("1.0", f"{excess + 1}.0")
+        if self._line_count > self._max_lines + self._trim_slack:
+            excess = self._line_count - self._max_lines
+            # Drop whole messages, from the mirror and the widget alike
+            popleft = self._lines.popleft
+            removed = 0
+            while removed < excess:
+                removed += popleft()[0].count("\n")
+            self._text.delete("1.0", f"{removed + 1}.0")
+            self._line_count -= removed
 
     def clear(self) -> None:
+        self._lines.clear()
+        if self._view is not None:
+            self._view.clear()
+            return
         self._text.config(state="normal")
         self._text.delete("1.0", "end")
         self._text.config(state="disabled")
+        self._line_count = 0
 
     def save_to_file(self) -> None:
         path = filedialog.asksaveasfilename(
@@ -97,10 +161,9 @@ class TerminalPanel(ttk.Frame):
         )
         if not path:
             return
-        content = self._text.get("1.0", "end")
         try:
             with open(path, "w", encoding="utf-8", newline="") as f:
-                f.write(content)
+                f.writelines(line for line, _tag in self._lines)
         except OSError as exc:
             from tkinter import messagebox
             messagebox.showerror("Save Failed", str(exc))
@@ -1,7 +1,12 @@
-import csv
+import collections
 import datetime
+import io
+import re
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from tkinter import ttk
 from typing import Callable, List, Optional
 
 from app.config import AppConfig
@@ -19,6 +24,14 @@ _RESULT_TAGS = {
 _CHECKBOX_CHECKED = "☑"
 _CHECKBOX_EMPTY   = "☐"
 
+# Nav column text keyed by (has setup/teardown/trigger commands, manual)
+_NAV_TABLE = {
+    (False, False): "",
+    (True,  False): "⚙",
+    (False, True):  "M",
+    (True,  True):  "M⚙",
+}
+
 _COLUMNS = ("enabled", "nav", "name", "command", "expected", "terminator", "timeout_ms", "result")
 _HEADINGS = {
     "result":      "Result",
@@ -40,6 +53,10 @@ _WIDTHS = {
     "terminator": 80,
     "timeout_ms": 80,
 }
+# (column, heading, width, stretch) in display order, for _setup_ui
+_COLUMN_SPECS = tuple(
+    (col, _HEADINGS[col], _WIDTHS[col], col == "name") for col in _COLUMNS
+)
 
 # Treeview row tags for each result state
 _ROW_TAGS = {
@@ -48,12 +65,114 @@ _ROW_TAGS = {
     "TIMEOUT": {"foreground": "#FFD700"},
     "ERROR":   {"foreground": "#FF9100"},
 }
+
+# Shared, immutable tags tuples for a row, keyed by result status
+_EMPTY_TAGS: tuple = ()
+_TAG_TUPLES = {status: (status,) for status in _ROW_TAGS}
+
+# Fully expanded tag_configure arguments, built once at import
+_ROW_TAG_ITEMS = tuple(_ROW_TAGS.items())
+_RESULT_TAG_ITEMS = tuple(
+    (status, {**colors, "font": ("Courier", 9, "bold")})
+    for status, colors in _RESULT_TAGS.items()
+)
+# Rows inserted per event-loop slice when syncing a large suite; the first
+# screenful shows at once and the rest streams in while Tk stays responsive
+_SYNC_INSERT_CHUNK = 200
+
+# The connection panel scans ports just before this panel is built; reuse a
+# scan that recent instead of enumerating again at start-up
+_PORTS_MAX_AGE_S = 2.0
+
+# Quiet period before test edits are serialised into the config
+_TESTS_SAVE_DELAY_MS = 500
+
+# Results from the runner thread are queued and rendered in batches this often
+_RESULT_FLUSH_MS = 30
+_RESULT_FLUSH_MAX = 500     # results rendered per tick; the rest wait for the next
+
+_CSV_BUFFER = 1024 * 1024   # one large block per CSV write instead of many small ones
+
+
+def _open_csv(path, mode: str) -> io.TextIOWrapper:
+    """Open *path* ("w" or "a") as a fully buffered text stream for CSV lines."""
+    return io.TextIOWrapper(
+        open(path, mode + "b", buffering=_CSV_BUFFER),
+        encoding="utf-8",
+        newline="",
+        write_through=False,
+    )
+
+
+_CSV_NEEDS_QUOTES = re.compile(r'[,"\r\n]').search
+
+
+def _csv_field(value) -> str:
+    text = value if value.__class__ is str else str(value)
+    if _CSV_NEEDS_QUOTES(text) is None:
+        return text
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _csv_line(fields) -> str:
+    """One CSV record, quoted the way csv.writer does by default (QUOTE_MINIMAL).
+
+    Almost every field here is a plain timestamp, name or status, so a
+    single regex test per field is much cheaper than the csv module.
+    """
+    return ",".join(map(_csv_field, fields)) + "\r\n"
+
+
 _RESULT_LABEL = {
     "PASS":    "✔  PASS",
     "FAIL":    "✘  FAIL",
     "TIMEOUT": "⏱  TIMEOUT",
     "ERROR":   "⚠  ERROR",
 }
+# status → " <icon> <status padded>  " prefix of a results-log line, built once
+_STATUS_PREFIX = {
+    status: f" {label[0]} {status:<7s}  " for status, label in _RESULT_LABEL.items()
+}
+# status → shared (label, status) value for _result_map
+_STATUS_ENTRY = {status: (label, status) for status, label in _RESULT_LABEL.items()}
+_PREVIEW_LEN = 50   # chars of the response shown in a results-log line
+
+
+@dataclass(slots=True)
+class _RunEntry:
+    """One completed test of the current run and when it completed.
+
+    *ns* is ``time.monotonic_ns()``; ``_entry_wall_time`` turns it into a
+    wall-clock time only when a CSV is written.
+    """
+    result: TestResult
+    ns: int
+
+
+def _fmt_ts(ts: datetime.datetime) -> str:
+    """``YYYY-MM-DDTHH:MM:SS`` for the CSV files, without strftime's locale path."""
+    return ts.isoformat(timespec="seconds")
+
+
+def _entry_wall_time(entry: _RunEntry, start_wall: datetime.datetime,
+                     start_ns: int) -> datetime.datetime:
+    return start_wall + datetime.timedelta(microseconds=(entry.ns - start_ns) // 1000)
+
+
+# TestCase.trigger_timing value ↔ label in the edit dialog's combobox
+_TRIG_TIMING_TO_LABEL = {
+    "before_setup": "Before setup commands",
+    "after_setup":  "After setup commands",
+}
+_TRIG_TIMING_FROM_LABEL = {v: k for k, v in _TRIG_TIMING_TO_LABEL.items()}
+
+_NONEMPTY_LINE_RE = re.compile(r"[^\r\n]+")
+
+
+def _read_cmd_lines(widget: tk.Text) -> list:
+    """Non-blank lines of *widget*, in one pass over its text."""
+    raw = widget.get("1.0", "end-1c")
+    return [ln for ln in _NONEMPTY_LINE_RE.findall(raw) if not ln.isspace()]
 
 
 class TestSuitePanel(ttk.Frame):
@@ -66,6 +185,9 @@ class TestSuitePanel(ttk.Frame):
         self._handler_provider = handler_provider
         self._le_provider = le_provider
         self._tests: List[TestCase] = []
+        # Test ID → TestCase / position in _tests; see _rebuild_index
+        self._tests_by_id: dict = {}
+        self._tests_index: dict = {}
         self._runner = TestRunner()
         self._pass_count = 0
         self._fail_count = 0
@@ -73,14 +195,60 @@ class TestSuitePanel(ttk.Frame):
         self._current_csv_path = None
         # Maps test ID → result label string; persists across tree repopulations
         self._result_map: dict = {}
+        # Test ID → (values, tags) last pushed by _populate_tree.  Cell updates
+        # made elsewhere (result column, enabled toggle) always match the
+        # model, so a stale entry can only cause a redundant write, never a
+        # missed one.
+        self._tree_snapshot: dict = {}
+        # Row order as last synced; only _sync_tree inserts/moves/deletes rows,
+        # so this mirrors the Treeview without reading it back
+        self._tree_order: List[str] = []
+        self._sync_after_id = None   # after_idle() ID of a pending sync continuation
+        # Where that continuation resumes: (next index, ids placed so far,
+        # order before the sync, position in it, ids moved out of it)
+        self._sync_state: Optional[tuple] = None
+        self._tree_dirty = False     # _tests changed while the tree was hidden
+        # Derived from _tests for the CSV writers; reset by
+        # _invalidate_csv_headers, which runs after every
+        # add/edit/delete/reorder/load
+        self._csv_headers_cache: Optional[List[str]] = None
+        self._wide_headers_cache: Optional[List[str]] = None
+        self._test_ids_cache: Optional[List[str]] = None
+        # CSV files are written (and trigger ports rescanned) here so slow
+        # storage or enumeration never blocks Tk; a single worker keeps the
+        # writes in submission order
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-writer")
+        # Futures of writes whose notices the flush tick still waits for, and
+        # the (callback, *args) notices the worker posts for the Tk thread.
+        # The worker never calls into Tk itself: with threaded Tcl, after()
+        # from another thread blocks until the Tk thread services it.
+        self._io_futures: collections.deque = collections.deque()
+        self._io_notices: collections.deque = collections.deque()
+        # CSV files kept open across loop iterations, path → file;
+        # I/O thread only, closed when the run ends
+        self._csv_files: dict = {}
         # Accumulated results for the current (or most recent) run
-        self._run_results: List[TestResult] = []
-        self._run_timestamps: List[datetime.datetime] = []
+        self._run_entries: List[_RunEntry] = []
+        # Entries appended by the runner thread and drained by _flush_results
+        # on the Tk thread
+        self._pending_results: collections.deque = collections.deque()
+        self._flush_after_id = None
+        # Results log cap; trimmed in ~10 % chunks like the terminal
+        self._results_max_lines: int = config.get("results_log_max_lines", 5000)
+        self._results_trim_slack: int = max(self._results_max_lines // 10, 1)
+        self._results_line_count = 0
+        self._pending_log: List[tuple] = []   # (text, tag) lines not yet inserted
+        self._log_flush_id = None
         # Loop mode state
         self._loop_var = tk.BooleanVar(value=False)
         self._current_run_tests: List[TestCase] = []
         self._stop_requested: bool = False
         self._loop_after_id = None   # after() ID while a loop-interval countdown is pending
+        self._save_pending_id = None # after() ID of a scheduled _flush_tests_to_config
+        self._delay_ms: Optional[int] = None  # parsed _delay_var; None = re-read
+        # Add/Edit dialog, built on first use and then withdrawn between uses
+        self._edit_dialog: Optional[tk.Toplevel] = None
+        self._edit_target: Optional[TestCase] = None
 
         self._setup_ui()
         self._load_tests_from_config()
@@ -91,8 +259,7 @@ class TestSuitePanel(ttk.Frame):
         self.rowconfigure(4, weight=1)
 
         # --- Trigger Device ---
-        from app.serial_handler import list_serial_ports
-        from app.config import BAUD_RATES
+        from app.config import BAUD_RATE_STRS
 
         trigger_frame = ttk.LabelFrame(self, text="Trigger Device")
         trigger_frame.grid(row=0, column=0, sticky="ew", padx=4, pady=(4, 0))
@@ -110,13 +277,13 @@ class TestSuitePanel(ttk.Frame):
         self._trigger_port_combo.pack(side="left", padx=2)
 
         ttk.Button(trigger_frame, text="⟳", width=2,
-                   command=self._refresh_trigger_ports).pack(side="left", padx=2)
+                   command=self._rescan_trigger_ports).pack(side="left", padx=2)
 
         ttk.Label(trigger_frame, text="Baud:").pack(side="left", padx=(8, 2))
         self._trigger_baud_combo = ttk.Combobox(
             trigger_frame,
             textvariable=self._trigger_baud_var,
-            values=[str(b) for b in BAUD_RATES],
+            values=BAUD_RATE_STRS,
             width=9,
             state="readonly",
         )
@@ -151,20 +318,21 @@ class TestSuitePanel(ttk.Frame):
             show="headings",
             selectmode="browse",
         )
-        for col in _COLUMNS:
-            self._tree.heading(col, text=_HEADINGS[col])
-            self._tree.column(col, width=_WIDTHS[col], minwidth=30, stretch=(col == "name"))
+        for col, heading, width, stretch in _COLUMN_SPECS:
+            self._tree.heading(col, text=heading)
+            self._tree.column(col, width=width, minwidth=30, stretch=stretch)
 
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self._tree.yview)
         self._tree.configure(yscrollcommand=vsb.set)
         self._tree.grid(row=0, column=0, sticky="nsew")
         vsb.grid(row=0, column=1, sticky="ns")
 
-        for tag_name, colors in _ROW_TAGS.items():
-            self._tree.tag_configure(tag_name, **colors)
+        for tag_name, opts in _ROW_TAG_ITEMS:
+            self._tree.tag_configure(tag_name, **opts)
 
         self._tree.bind("<Double-1>", lambda _: self._edit_test())
         self._tree.bind("<Button-1>", self._on_tree_click)
+        self._tree.bind("<Map>", self._on_tree_map)
 
         # --- Run bar ---
         run_bar = ttk.Frame(self)
@@ -195,12 +363,18 @@ class TestSuitePanel(ttk.Frame):
         ttk.Separator(run_bar, orient="vertical").pack(side="left", padx=8, fill="y")
         ttk.Label(run_bar, text="Delay between tests (ms):").pack(side="left")
         self._delay_var = tk.StringVar(value=str(self._config.get("test_delay_ms", 200)))
+        self._delay_var.trace_add("write", self._on_delay_changed)
         ttk.Spinbox(run_bar, from_=0, to=10000, increment=50,
                     textvariable=self._delay_var, width=6).pack(side="left", padx=4)
 
         # --- Results panel ---
-        self._results = scrolledtext.ScrolledText(
-            self,
+        results_frame = ttk.Frame(self)
+        results_frame.grid(row=4, column=0, sticky="nsew", padx=4, pady=(0, 2))
+        results_frame.columnconfigure(0, weight=1)
+        results_frame.rowconfigure(0, weight=1)
+
+        self._results = tk.Text(
+            results_frame,
             state="disabled",
             font=("Courier", 9),
             bg="#1C1C1C",
@@ -208,9 +382,13 @@ class TestSuitePanel(ttk.Frame):
             height=8,
             relief="flat",
         )
-        self._results.grid(row=4, column=0, sticky="nsew", padx=4, pady=(0, 2))
-        for status, colors in _RESULT_TAGS.items():
-            self._results.tag_configure(status, **colors, font=("Courier", 9, "bold"))
+        results_vsb = ttk.Scrollbar(results_frame, orient="vertical",
+                                    command=self._results.yview)
+        self._results.configure(yscrollcommand=results_vsb.set)
+        self._results.grid(row=0, column=0, sticky="nsew")
+        results_vsb.grid(row=0, column=1, sticky="ns")
+        for status, opts in _RESULT_TAG_ITEMS:
+            self._results.tag_configure(status, **opts)
         self._results.tag_configure("header", foreground="#AAAAAA")
 
         # --- Summary bar ---
@@ -230,7 +408,18 @@ class TestSuitePanel(ttk.Frame):
 
     def _refresh_trigger_ports(self) -> None:
         from app.serial_handler import list_serial_ports
-        ports = list_serial_ports()
+        self._apply_trigger_ports(list_serial_ports(max_age_s=_PORTS_MAX_AGE_S))
+
+    def _rescan_trigger_ports(self) -> None:
+        """⟳ button: enumerate on the I/O worker so Tk doesn't freeze meanwhile."""
+        self._submit_io(self._scan_trigger_ports)
+
+    def _scan_trigger_ports(self) -> None:
+        """Runs on the I/O thread; the result is applied by the flush tick."""
+        from app.serial_handler import list_serial_ports
+        self._io_notices.append((self._apply_trigger_ports, list_serial_ports()))
+
+    def _apply_trigger_ports(self, ports: list) -> None:
         self._trigger_port_map = {desc: dev for dev, desc in ports}
         display_names = [desc for _, desc in ports]
         self._trigger_port_combo["values"] = display_names
@@ -253,6 +442,7 @@ class TestSuitePanel(ttk.Frame):
         desc = self._trigger_port_var.get()
         port = self._trigger_port_map.get(desc, desc)
         if not port:
+            from tkinter import messagebox
             messagebox.showwarning("Trigger Device", "Select a port first.")
             return
         try:
@@ -265,6 +455,7 @@ class TestSuitePanel(ttk.Frame):
                 port=port, baud=baud, parity="N", databits=8, stopbits=1
             )
         except Exception as exc:
+            from tkinter import messagebox
             messagebox.showerror("Trigger Device", f"Connection failed: {exc}")
             return
 
@@ -285,50 +476,176 @@ class TestSuitePanel(ttk.Frame):
             self._trigger_baud_combo.config(state="readonly")
 
     def cleanup(self) -> None:
-        """Disconnect the trigger handler on window close."""
+        """Write out pending test edits and disconnect the trigger handler on window close."""
+        self._flush_pending_save()
         if self._trigger_handler.is_connected:
             self._trigger_handler.disconnect()
+        # Queued CSV writes finish in the worker before the interpreter exits;
+        # waiting for them here would hold up the close
+        self._io_pool.submit(self._close_csv_files)
+        self._io_pool.shutdown(wait=False)
 
     # ------------------------------------------------------------------ #
     #  Treeview helpers
     # ------------------------------------------------------------------ #
 
-    def _populate_tree(self) -> None:
-        self._tree.delete(*self._tree.get_children())
-        for tc in self._tests:
+    def _row_for(self, tc: TestCase) -> tuple:
+        """Return the ``(values, tags)`` the Treeview row for *tc* should show."""
+        cells = tc._row_cache
+        if cells is None:
             has_nav = bool(tc.setup_commands or tc.teardown_commands or tc.trigger_commands)
-            nav_indicator = ("M" if tc.manual else "") + ("⚙" if has_nav else "")
-            result_entry = self._result_map.get(tc.id)  # (label, status) or None
-            result_label = result_entry[0] if result_entry else ""
-            result_tag   = result_entry[1] if result_entry else ""
-            self._tree.insert(
-                "", "end", iid=tc.id,
-                values=(
-                    _CHECKBOX_CHECKED if tc.enabled else _CHECKBOX_EMPTY,
-                    nav_indicator,
-                    tc.name,
-                    tc.command,
-                    tc.expected.replace("\n", " ∧ "),
-                    tc.terminator,
-                    tc.timeout_ms,
-                    result_label,
-                ),
-                tags=(result_tag,) if result_tag else (),
+            nav_indicator = _NAV_TABLE[has_nav, bool(tc.manual)]
+            cells = tc._row_cache = (
+                _CHECKBOX_CHECKED if tc.enabled else _CHECKBOX_EMPTY,
+                nav_indicator,
+                tc.name,
+                tc.command,
+                tc.expected_display,
+                tc.terminator,
+                tc.timeout_ms,
             )
+        result_entry = self._result_map.get(tc.id)  # (label, status) or None
+        if result_entry is None:
+            return cells + ("",), _EMPTY_TAGS
+        label, status = result_entry
+        return cells + (label,), _TAG_TUPLES.get(status) or (status,)
+
+    def _populate_tree(self) -> None:
+        """Bring the Treeview in line with ``self._tests`` once it is on screen.
+
+        While the Test Suite tab is hidden (including at start-up) the rows
+        are not materialised at all; ``_on_tree_map`` syncs them when the tree
+        is shown.
+        """
+        self._invalidate_csv_headers()
+        if not self._tree.winfo_viewable():
+            # A half-done sync would resume against the old _tests
+            self._cancel_sync()
+            self._tree_dirty = True
+            return
+        self._sync_tree()
+
+    def _on_tree_map(self, *_) -> None:
+        if self._tree_dirty:
+            self._sync_tree()
+
+    def _sync_tree(self) -> None:
+        """Bring the Treeview in line with ``self._tests``.
+
+        Only rows that were added, removed, moved or changed since the last
+        call are touched, so an edit or a reorder costs a handful of Tcl calls
+        instead of rebuilding every row.
+        """
+        self._tree_dirty = False
+        self._cancel_sync()
+        tree = self._tree
+        snapshot = self._tree_snapshot
+        wanted = {tc.id for tc in self._tests}
+        stale = [iid for iid in snapshot if iid not in wanted]
+        order = self._tree_order
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del snapshot[iid]
+            order = [iid for iid in order if iid in wanted]
+        self._sync_rows(0, [], order, 0, set())
+
+    def _sync_rows(self, start: int, placed: List[str], old: List[str],
+                   pos: int, moved: set) -> None:
+        """Sync ``_tests[start:]``, yielding to Tk after each insert chunk.
+
+        Rows ``[0, start)`` are in place (their IDs are *placed*); below them
+        the tree holds the rows of *old* from *pos* on that are not in
+        *moved*, still in their old order.  So the row at *start* is the
+        first of those, and a test is moved only if it isn't that row.
+        """
+        tree = self._tree
+        snapshot = self._tree_snapshot
+        tests = self._tests
+        n_old = len(old)
+        # Tk already defers the repaint until the event loop is idle, so the
+        # whole sync draws once.  What does add up per row on a bulk load is
+        # Treeview.insert/item re-formatting their options into Tcl strings;
+        # calling the widget command directly hands the tuples over as-is.
+        call = tree.tk.call
+        w = str(tree)
+        inserted = 0
+        for idx in range(start, len(tests)):
+            tc = tests[idx]
+            iid = tc.id
+            row = self._row_for(tc)
+            prev = snapshot.get(iid)
+            if prev is None:
+                if inserted == _SYNC_INSERT_CHUNK:
+                    # Rows above are in place; carry on from here when idle
+                    self._sync_state = (idx, placed, old, pos, moved)
+                    self._sync_after_id = self.after_idle(self._continue_sync)
+                    return
+                inserted += 1
+                call(w, "insert", "", idx, "-id", iid, "-values", row[0], "-tags", row[1])
+            else:
+                if prev != row:
+                    call(w, "item", iid, "-values", row[0], "-tags", row[1])
+                while pos < n_old and old[pos] in moved:
+                    pos += 1
+                if pos < n_old and old[pos] == iid:
+                    pos += 1
+                else:
+                    tree.move(iid, "", idx)
+                    moved.add(iid)
+            placed.append(iid)
+            snapshot[iid] = row
+        self._tree_order = placed
+
+    def _cancel_sync(self) -> None:
+        """Drop a pending sync continuation, recording the row order it left."""
+        if self._sync_after_id is None:
+            return
+        self.after_cancel(self._sync_after_id)
+        self._sync_after_id = None
+        _start, placed, old, pos, moved = self._sync_state
+        self._sync_state = None
+        self._tree_order = placed + [iid for iid in old[pos:] if iid not in moved]
+
+    def _refresh_row(self, tc: TestCase) -> None:
+        """Re-render the row for *tc* (if it is materialised) in one widget call."""
+        if tc.id not in self._tree_snapshot:
+            return
+        row = self._row_for(tc)
+        tree = self._tree
+        tree.tk.call(str(tree), "item", tc.id, "-values", row[0], "-tags", row[1])
+        self._tree_snapshot[tc.id] = row
+
+    def _continue_sync(self) -> None:
+        self._sync_after_id = None
+        state = self._sync_state
+        self._sync_state = None
+        self._sync_rows(*state)
+
+    def _rebuild_index(self) -> None:
+        """Refresh the ID lookups; call after any change to ``_tests``."""
+        self._tests_by_id = {tc.id: tc for tc in self._tests}
+        self._tests_index = {tc.id: i for i, tc in enumerate(self._tests)}
+
+    def _reindex_from(self, start: int) -> None:
+        """Refresh positions of ``_tests[start:]`` after an insert/remove there."""
+        index = self._tests_index
+        for i in range(start, len(self._tests)):
+            index[self._tests[i].id] = i
 
     def _selected_test(self) -> Optional[TestCase]:
         sel = self._tree.selection()
         if not sel:
             return None
         iid = sel[0]
-        return next((t for t in self._tests if t.id == iid), None)
+        return self._tests_by_id.get(iid)
 
     def _selected_index(self) -> int:
         sel = self._tree.selection()
         if not sel:
             return -1
         iid = sel[0]
-        return next((i for i, t in enumerate(self._tests) if t.id == iid), -1)
+        return self._tests_index.get(iid, -1)
 
     def _on_tree_click(self, event) -> None:
         region = self._tree.identify_region(event.x, event.y)
@@ -336,11 +653,14 @@ class TestSuitePanel(ttk.Frame):
         if region == "cell" and col == "#1":  # enabled column
             item = self._tree.identify_row(event.y)
             if item:
-                tc = next((t for t in self._tests if t.id == item), None)
+                tc = self._tests_by_id.get(item)
                 if tc:
                     tc.enabled = not tc.enabled
-                    self._tree.set(item, "enabled",
-                                   _CHECKBOX_CHECKED if tc.enabled else _CHECKBOX_EMPTY)
+                    glyph = _CHECKBOX_CHECKED if tc.enabled else _CHECKBOX_EMPTY
+                    if tc._row_cache is not None:
+                        # Only the first cell changed; patch rather than rebuild
+                        tc._row_cache = (glyph,) + tc._row_cache[1:]
+                    self._refresh_row(tc)
                     self._save_tests_to_config()
 
     # ------------------------------------------------------------------ #
@@ -353,6 +673,7 @@ class TestSuitePanel(ttk.Frame):
     def _edit_test(self) -> None:
         tc = self._selected_test()
         if tc is None:
+            from tkinter import messagebox
             messagebox.showinfo("Edit Test", "Select a test to edit.")
             return
         self._open_test_dialog(tc)
@@ -361,8 +682,12 @@ class TestSuitePanel(ttk.Frame):
         tc = self._selected_test()
         if tc is None:
             return
+        from tkinter import messagebox
         if messagebox.askyesno("Delete Test", f"Delete '{tc.name}'?"):
-            self._tests = [t for t in self._tests if t.id != tc.id]
+            idx = self._tests_index.pop(tc.id)
+            del self._tests[idx]
+            del self._tests_by_id[tc.id]
+            self._reindex_from(idx)
             self._populate_tree()
             self._save_tests_to_config()
 
@@ -370,42 +695,98 @@ class TestSuitePanel(ttk.Frame):
         idx = self._selected_index()
         if idx <= 0:
             return
-        self._tests[idx], self._tests[idx - 1] = self._tests[idx - 1], self._tests[idx]
-        self._populate_tree()
-        self._tree.selection_set(self._tests[idx - 1].id)
+        self._swap_tests(idx, idx - 1)
         self._save_tests_to_config()
 
+    def _swap_tests(self, i: int, j: int) -> None:
+        """Swap two adjacent tests in the list, the position index and the tree.
+
+        The selection stays on the moved row, so nothing else is re-rendered.
+        """
+        tests = self._tests
+        tests[i], tests[j] = tests[j], tests[i]
+        self._tests_index[tests[i].id] = i
+        self._tests_index[tests[j].id] = j
+        order = self._tree_order
+        if self._tree_dirty or self._sync_after_id is not None or len(order) != len(tests):
+            # Rows are not (all) materialised yet; let the sync place them
+            self._populate_tree()
+            return
+        self._invalidate_csv_headers()
+        # Always move the row that goes up: its index is unaffected by where
+        # the other row currently sits
+        k = min(i, j)
+        self._tree.move(tests[k].id, "", k)
+        order[i], order[j] = order[j], order[i]
+
     def _move_down(self) -> None:
         idx = self._selected_index()
         if idx < 0 or idx >= len(self._tests) - 1:
             return
-        self._tests[idx], self._tests[idx + 1] = self._tests[idx + 1], self._tests[idx]
-        self._populate_tree()
-        self._tree.selection_set(self._tests[idx + 1].id)
+        self._swap_tests(idx, idx + 1)
         self._save_tests_to_config()
 
     def _open_test_dialog(self, tc: Optional[TestCase]) -> None:
-        dialog = tk.Toplevel(self)
+        """Show the Add/Edit dialog for *tc* (``None`` adds a new test).
+
+        The dialog is built once and then hidden/re-shown, so opening it only
+        re-seeds the fields.
+        """
+        if self._edit_dialog is None:
+            self._build_edit_dialog()
+        dialog = self._edit_dialog
+        self._edit_target = tc
         dialog.title("Edit Test" if tc else "Add Test")
-        dialog.resizable(True, True)
+
+        v = self._edit_vars
+        v["name"].set(tc.name if tc else "")
+        v["command"].set(tc.command if tc else "")
+        v["terminator"].set(tc.terminator if tc else "OK")
+        v["timeout_ms"].set(str(tc.timeout_ms) if tc else "2000")
+        v["nav_timeout_ms"].set(str(tc.nav_timeout_ms) if tc else "1000")
+        self._manual_var.set(tc.manual if tc else False)
+        timing = tc.trigger_timing if tc else "before_setup"
+        self._trigger_timing_var.set(
+            _TRIG_TIMING_TO_LABEL.get(timing, _TRIG_TIMING_TO_LABEL["before_setup"])
+        )
+        for widget, text in (
+            (self._expected_text, tc.expected if tc else ""),
+            (self._numeric_text,  tc.numeric_checks if tc else ""),
+            (self._trigger_text,  "\n".join(tc.trigger_commands) if tc else ""),
+            (self._setup_text,    "\n".join(tc.setup_commands) if tc else ""),
+            (self._td_text,       "\n".join(tc.teardown_commands) if tc else ""),
+        ):
+            widget.delete("1.0", "end")
+            if text:
+                widget.insert("1.0", text)
+
+        dialog.deiconify()
+        dialog.lift()
         dialog.grab_set()
+
+    def _build_edit_dialog(self) -> None:
+        dialog = tk.Toplevel(self)
+        dialog.resizable(True, True)
         dialog.columnconfigure(1, weight=1)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_edit_dialog)
+        self._edit_dialog = dialog
 
         pad = {"padx": 8, "pady": 3}
 
         # --- Single-line fields ---
         single_fields = [
-            ("Name:",             tc.name        if tc else "",    "name"),
-            ("Command:",          tc.command     if tc else "",    "command"),
-            ("Terminator:",       tc.terminator  if tc else "OK",  "terminator"),
-            ("Timeout (ms):",     str(tc.timeout_ms)  if tc else "2000", "timeout_ms"),
-            ("Nav timeout (ms):", str(tc.nav_timeout_ms) if tc else "1000", "nav_timeout_ms"),
+            ("Name:",             "name"),
+            ("Command:",          "command"),
+            ("Terminator:",       "terminator"),
+            ("Timeout (ms):",     "timeout_ms"),
+            ("Nav timeout (ms):", "nav_timeout_ms"),
         ]
 
         vars_: dict = {}
-        for row, (label, default, key) in enumerate(single_fields):
+        self._edit_vars = vars_
+        for row, (label, key) in enumerate(single_fields):
             ttk.Label(dialog, text=label).grid(row=row, column=0, sticky="e", **pad)
-            v = tk.StringVar(value=default)
+            v = tk.StringVar()
             vars_[key] = v
             ttk.Entry(dialog, textvariable=v, width=40).grid(
                 row=row, column=1, sticky="ew", **pad
@@ -413,7 +794,7 @@ class TestSuitePanel(ttk.Frame):
 
         # --- Manual verdict checkbox ---
         manual_row = len(single_fields)
-        self._manual_var = tk.BooleanVar(value=tc.manual if tc else False)
+        self._manual_var = tk.BooleanVar()
         ttk.Label(dialog, text="Manual verdict:").grid(
             row=manual_row, column=0, sticky="e", **pad
         )
@@ -444,8 +825,6 @@ class TestSuitePanel(ttk.Frame):
         self._expected_text.configure(yscrollcommand=exp_vsb.set)
         self._expected_text.grid(row=0, column=0, sticky="nsew")
         exp_vsb.grid(row=0, column=1, sticky="ns")
-        if tc and tc.expected:
-            self._expected_text.insert("1.0", tc.expected)
 
         # --- Numeric checks ---
         num_row = exp_row + 1
@@ -468,8 +847,6 @@ class TestSuitePanel(ttk.Frame):
         self._numeric_text.configure(yscrollcommand=num_vsb.set)
         self._numeric_text.grid(row=0, column=0, sticky="nsew")
         num_vsb.grid(row=0, column=1, sticky="ns")
-        if tc and tc.numeric_checks:
-            self._numeric_text.insert("1.0", tc.numeric_checks)
 
         sep_row = num_row + 1
         ttk.Separator(dialog, orient="horizontal").grid(
@@ -497,21 +874,17 @@ class TestSuitePanel(ttk.Frame):
         self._trigger_text.configure(yscrollcommand=trig_vsb.set)
         self._trigger_text.grid(row=0, column=0, sticky="nsew")
         trig_vsb.grid(row=0, column=1, sticky="ns")
-        if tc and tc.trigger_commands:
-            self._trigger_text.insert("1.0", "\n".join(tc.trigger_commands))
 
         # --- Trigger timing ---
         timing_row = trig_row + 1
         ttk.Label(dialog, text="Trigger timing:").grid(
             row=timing_row, column=0, sticky="e", **pad
         )
-        timing_default = tc.trigger_timing if tc else "before_setup"
-        timing_display = "After setup commands" if timing_default == "after_setup" else "Before setup commands"
-        self._trigger_timing_var = tk.StringVar(value=timing_display)
+        self._trigger_timing_var = tk.StringVar()
         ttk.Combobox(
             dialog,
             textvariable=self._trigger_timing_var,
-            values=["Before setup commands", "After setup commands"],
+            values=list(_TRIG_TIMING_TO_LABEL.values()),
             state="readonly",
             width=22,
         ).grid(row=timing_row, column=1, sticky="w", **pad)
@@ -537,8 +910,6 @@ class TestSuitePanel(ttk.Frame):
         self._setup_text.configure(yscrollcommand=setup_vsb.set)
         self._setup_text.grid(row=0, column=0, sticky="nsew")
         setup_vsb.grid(row=0, column=1, sticky="ns")
-        if tc and tc.setup_commands:
-            self._setup_text.insert("1.0", "\n".join(tc.setup_commands))
 
         # --- Multiline: teardown commands ---
         td_row = setup_row + 1
@@ -561,81 +932,85 @@ class TestSuitePanel(ttk.Frame):
         self._td_text.configure(yscrollcommand=td_vsb.set)
         self._td_text.grid(row=0, column=0, sticky="nsew")
         td_vsb.grid(row=0, column=1, sticky="ns")
-        if tc and tc.teardown_commands:
-            self._td_text.insert("1.0", "\n".join(tc.teardown_commands))
 
         # --- OK / Cancel ---
         btn_row = td_row + 1
 
-        def _read_cmd_lines(widget: tk.Text) -> list:
-            raw = widget.get("1.0", "end-1c")
-            return [ln for ln in raw.splitlines() if ln.strip()]
-
-        def _ok():
-            name = vars_["name"].get().strip()
-            if not name:
-                messagebox.showwarning("Validation", "Name is required.", parent=dialog)
-                return
-            try:
-                timeout     = int(vars_["timeout_ms"].get())
-                nav_timeout = int(vars_["nav_timeout_ms"].get())
-            except ValueError:
-                messagebox.showwarning("Validation", "Timeouts must be integers.", parent=dialog)
-                return
-
-            setup_cmds     = _read_cmd_lines(self._setup_text)
-            td_cmds        = _read_cmd_lines(self._td_text)
-            numeric_checks = self._numeric_text.get("1.0", "end-1c").strip()
-            trigger_cmds   = _read_cmd_lines(self._trigger_text)
-            trigger_timing = (
-                "after_setup"
-                if self._trigger_timing_var.get() == "After setup commands"
-                else "before_setup"
-            )
-            manual = self._manual_var.get()
-
-            if tc is not None:
-                tc.name              = name
-                tc.command           = vars_["command"].get().strip()
-                tc.expected          = self._expected_text.get("1.0", "end-1c").strip()
-                tc.terminator        = vars_["terminator"].get().strip()
-                tc.timeout_ms        = timeout
-                tc.nav_timeout_ms    = nav_timeout
-                tc.setup_commands    = setup_cmds
-                tc.teardown_commands = td_cmds
-                tc.numeric_checks    = numeric_checks
-                tc.trigger_commands  = trigger_cmds
-                tc.trigger_timing    = trigger_timing
-                tc.manual            = manual
-            else:
-                new_tc = TestCase(
-                    name=name,
-                    command=vars_["command"].get().strip(),
-                    expected=self._expected_text.get("1.0", "end-1c").strip(),
-                    terminator=vars_["terminator"].get().strip(),
-                    timeout_ms=timeout,
-                    nav_timeout_ms=nav_timeout,
-                    setup_commands=setup_cmds,
-                    teardown_commands=td_cmds,
-                    numeric_checks=numeric_checks,
-                    trigger_commands=trigger_cmds,
-                    trigger_timing=trigger_timing,
-                    manual=manual,
-                )
-                self._tests.append(new_tc)
-
-            self._populate_tree()
-            self._save_tests_to_config()
-            dialog.destroy()
-
-        ttk.Button(dialog, text="OK",     command=_ok).grid(
+        ttk.Button(dialog, text="OK",     command=self._commit_edit).grid(
             row=btn_row, column=0, padx=8, pady=8, sticky="e"
         )
-        ttk.Button(dialog, text="Cancel", command=dialog.destroy).grid(
+        ttk.Button(dialog, text="Cancel", command=self._close_edit_dialog).grid(
             row=btn_row, column=1, padx=8, pady=8, sticky="w"
         )
         # Don't bind <Return> globally — it would fire inside the Text widgets
-        dialog.bind("<Escape>", lambda _: dialog.destroy())
+        dialog.bind("<Escape>", lambda _: self._close_edit_dialog())
+
+    def _close_edit_dialog(self) -> None:
+        self._edit_dialog.grab_release()
+        self._edit_dialog.withdraw()
+        self._edit_target = None
+
+    def _commit_edit(self) -> None:
+        dialog = self._edit_dialog
+        vars_ = self._edit_vars
+        tc = self._edit_target
+        name = vars_["name"].get().strip()
+        if not name:
+            from tkinter import messagebox
+            messagebox.showwarning("Validation", "Name is required.", parent=dialog)
+            return
+        try:
+            timeout     = int(vars_["timeout_ms"].get())
+            nav_timeout = int(vars_["nav_timeout_ms"].get())
+        except ValueError:
+            from tkinter import messagebox
+            messagebox.showwarning("Validation", "Timeouts must be integers.", parent=dialog)
+            return
+
+        setup_cmds     = _read_cmd_lines(self._setup_text)
+        td_cmds        = _read_cmd_lines(self._td_text)
+        numeric_checks = self._numeric_text.get("1.0", "end-1c").strip()
+        trigger_cmds   = _read_cmd_lines(self._trigger_text)
+        trigger_timing = _TRIG_TIMING_FROM_LABEL.get(
+            self._trigger_timing_var.get(), "before_setup"
+        )
+        manual = self._manual_var.get()
+
+        if tc is not None:
+            tc.name              = name
+            tc.command           = vars_["command"].get().strip()
+            tc.expected          = self._expected_text.get("1.0", "end-1c").strip()
+            tc.terminator        = vars_["terminator"].get().strip()
+            tc.timeout_ms        = timeout
+            tc.nav_timeout_ms    = nav_timeout
+            tc.setup_commands    = setup_cmds
+            tc.teardown_commands = td_cmds
+            tc.numeric_checks    = numeric_checks
+            tc.trigger_commands  = trigger_cmds
+            tc.trigger_timing    = trigger_timing
+            tc.manual            = manual
+            tc._row_cache        = None
+        else:
+            new_tc = TestCase(
+                name=name,
+                command=vars_["command"].get().strip(),
+                expected=self._expected_text.get("1.0", "end-1c").strip(),
+                terminator=vars_["terminator"].get().strip(),
+                timeout_ms=timeout,
+                nav_timeout_ms=nav_timeout,
+                setup_commands=setup_cmds,
+                teardown_commands=td_cmds,
+                numeric_checks=numeric_checks,
+                trigger_commands=trigger_cmds,
+                trigger_timing=trigger_timing,
+                manual=manual,
+            )
+            self._tests.append(new_tc)
+            self._rebuild_index()
+
+        self._populate_tree()
+        self._save_tests_to_config()
+        self._close_edit_dialog()
 
     # ------------------------------------------------------------------ #
     #  Run logic
@@ -688,14 +1063,17 @@ class TestSuitePanel(ttk.Frame):
     def _run_selected(self) -> None:
         sel = self._tree.selection()
         if not sel:
+            from tkinter import messagebox
             messagebox.showinfo("Run", "Select one or more tests first.")
             return
-        tests = [t for t in self._tests if t.id in sel]
+        by_id = self._tests_by_id
+        tests = [by_id[iid] for iid in sel if iid in by_id]
         self._start_run(tests)
 
     def _run_all(self) -> None:
         tests = [t for t in self._tests if t.enabled]
         if not tests:
+            from tkinter import messagebox
             messagebox.showinfo("Run All", "No enabled tests.")
             return
         self._start_run(tests)
@@ -703,24 +1081,26 @@ class TestSuitePanel(ttk.Frame):
     def _start_run(self, tests: List[TestCase]) -> None:
         handler = self._handler_provider()
         if not handler.is_connected:
+            from tkinter import messagebox
             messagebox.showwarning("Not Connected", "Connect to a serial port first.")
             return
 
+        # A run can last a long time; persist any edits made just before it
+        self._flush_pending_save()
+
         self._current_run_tests = tests
         self._stop_requested = False
         self._pass_count = 0
         self._fail_count = 0
         self._total_count = len(tests)
-        self._run_results = []
-        self._run_timestamps = []
+        self._run_entries = []
         self._run_start_ts = datetime.datetime.now()
+        self._run_start_ns = time.monotonic_ns()
 
         # Reset the result column for tests that are about to run
         for tc in tests:
             self._result_map.pop(tc.id, None)
-            if self._tree.exists(tc.id):
-                self._tree.set(tc.id, "result", "")
-                self._tree.item(tc.id, tags=())
+            self._refresh_row(tc)
 
         self._append_result(
             f"── Running {len(tests)} test(s) ──", "header"
@@ -742,13 +1122,20 @@ class TestSuitePanel(ttk.Frame):
         self._run_all_btn.config(state="disabled")
         self._stop_btn.config(state="normal")
 
-        try:
-            delay_ms = int(self._delay_var.get())
-        except ValueError:
-            delay_ms = 200
+        if self._delay_ms is None:
+            try:
+                self._delay_ms = int(self._delay_var.get())
+            except ValueError:
+                self._delay_ms = 200
+
+        pending = self._pending_results
+
+        # Completion times are raw monotonic_ns stamps; they are converted to
+        # wall-clock times (relative to the run start) only when exported.
+        monotonic_ns = time.monotonic_ns
 
-        def _safe_on_result(result: TestResult) -> None:
-            self.after(0, lambda r=result: self._on_result(r))
+        def _queue_result(result: TestResult) -> None:
+            pending.append(_RunEntry(result, monotonic_ns()))
 
         def _safe_on_done() -> None:
             self.after(0, self._on_done)
@@ -761,12 +1148,16 @@ class TestSuitePanel(ttk.Frame):
             tests=tests,
             handler=handler,
             line_ending=self._le_provider(),
-            on_result=_safe_on_result,
+            on_result=_queue_result,
             on_done=_safe_on_done,
-            delay_ms=delay_ms,
+            delay_ms=self._delay_ms,
             trigger_handler=trigger_handler,
             on_manual_input=_safe_on_manual_input,
         )
+        self._arm_flush_tick()
+
+    def _on_delay_changed(self, *_) -> None:
+        self._delay_ms = None
 
     def _stop_run(self) -> None:
         self._stop_requested = True
@@ -776,7 +1167,7 @@ class TestSuitePanel(ttk.Frame):
             self._loop_after_id = None
             total = self._pass_count + self._fail_count
             self._summary_var.set(f"{self._pass_count} / {total} passed")
-            self._current_csv_path = None
+            self._end_run_csv()
             self._run_sel_btn.config(state="normal")
             self._run_all_btn.config(state="normal")
             self._stop_btn.config(state="disabled")
@@ -800,34 +1191,64 @@ class TestSuitePanel(ttk.Frame):
         self._loop_countdown_remaining -= 1
         self._loop_after_id = self.after(1000, self._tick_loop_countdown)
 
-    def _on_result(self, result: TestResult) -> None:
-        status = result.status
-        label = _RESULT_LABEL.get(status, status)
-
-        # Update the treeview row live
-        self._result_map[result.test.id] = (label, status)
-        if self._tree.exists(result.test.id):
-            self._tree.set(result.test.id, "result", label)
-            self._tree.item(result.test.id, tags=(status,))
-
-        # Also append to the results log panel below
-        _ICON = {"PASS": "✔", "FAIL": "✘", "TIMEOUT": "⏱", "ERROR": "⚠"}
-        actual_preview = result.actual.replace("\n", " | ")[:50]
-        line = (
-            f" {_ICON.get(status, '?')} {status:<7s}  {result.test.name}  "
-            f"({result.duration_ms:.0f}ms)"
-            + (f"  {actual_preview}" if actual_preview else "")
-        )
-        self._append_result(line, status)
+    def _arm_flush_tick(self) -> None:
+        if self._flush_after_id is None:
+            self._flush_after_id = self.after(_RESULT_FLUSH_MS, self._flush_results_tick)
+
+    def _flush_results_tick(self) -> None:
+        self._flush_after_id = None
+        self._flush_results()
+        self._drain_io_notices()
+        if (self._runner.is_running or self._pending_results
+                or self._io_futures or self._io_notices):
+            self._arm_flush_tick()
+
+    def _submit_io(self, fn, *args) -> None:
+        """Queue *fn* on the csv-writer and poll for its notices until it is done."""
+        self._io_futures.append(self._io_pool.submit(fn, *args))
+        self._arm_flush_tick()
+
+    def _drain_io_notices(self) -> None:
+        # Futures are popped first: a finished write has already posted its
+        # notices, so they are all applied below
+        futures = self._io_futures
+        while futures and futures[0].done():
+            futures.popleft()
+        notices = self._io_notices
+        while notices:
+            fn, *args = notices.popleft()
+            fn(*args)
+
+    def _flush_results(self, max_n: int = _RESULT_FLUSH_MAX) -> None:
+        """Render up to *max_n* queued results: log lines, tree cells and summary."""
+        pending = self._pending_results
+        if not pending:
+            return
+        batch = [pending.popleft() for _ in range(min(max_n, len(pending)))]
+
+        latest: dict = {}   # test ID → (label, status); later results win
+        log_lines = []
+        for entry in batch:
+            result = entry.result
+            status = result.status
+            latest[result.test.id] = _STATUS_ENTRY.get(status) or (status, status)
+            log_lines.append((self._result_line(result), status))
+
+            self._run_entries.append(entry)
+            if status == "PASS":
+                self._pass_count += 1
+            else:
+                self._fail_count += 1
 
-        now = datetime.datetime.now()
-        self._run_results.append(result)
-        self._run_timestamps.append(now)
+        self._append_results(log_lines)
 
-        if status == "PASS":
-            self._pass_count += 1
-        else:
-            self._fail_count += 1
+        # Update the treeview rows once per test, not once per result
+        self._result_map.update(latest)
+        tests_by_id = self._tests_by_id
+        for test_id in latest:
+            tc = tests_by_id.get(test_id)
+            if tc is not None:
+                self._refresh_row(tc)
 
         done = self._pass_count + self._fail_count
         self._summary_var.set(
@@ -835,7 +1256,22 @@ class TestSuitePanel(ttk.Frame):
             + (f" ({self._total_count - done} remaining)" if done < self._total_count else "")
         )
 
+    def _result_line(self, result: TestResult) -> str:
+        status = result.status
+        prefix = _STATUS_PREFIX.get(status) or f" ? {status:<7s}  "
+        line = f"{prefix}{result.test.name}  ({result.duration_ms:.0f}ms)"
+        actual = result.actual
+        if not actual:
+            return line
+        if len(actual) > _PREVIEW_LEN or "\n" in actual:
+            # Only the first _PREVIEW_LEN chars survive, so don't replace
+            # newlines in the whole (possibly long) response
+            actual = actual[:_PREVIEW_LEN].replace("\n", " | ")[:_PREVIEW_LEN]
+        return line + "  " + actual
+
     def _on_done(self) -> None:
+        # The last results may still be queued behind this callback
+        self._flush_results(len(self._pending_results))
         completion_ts = datetime.datetime.now()
         total = self._pass_count + self._fail_count
         self._append_result(
@@ -843,23 +1279,18 @@ class TestSuitePanel(ttk.Frame):
         )
         self._summary_var.set(f"{self._pass_count} / {total} passed")
 
-        # Append one summary row to the cumulative run log
-        if self._run_results:
-            try:
-                log_dir = self._config.effective_log_dir()
-                log_dir.mkdir(parents=True, exist_ok=True)
-                csv_path = log_dir / "test_suite_log.csv"
-                self._append_run_row(csv_path, completion_ts)
-                self._append_result(f"  CSV log → {csv_path}", "header")
-            except Exception as exc:
-                self._append_result(f"  CSV log failed: {exc}", "ERROR")
-
-        # Write one wide-format row to the per-run CSV
-        if self._current_csv_path and self._run_start_ts and self._run_results:
-            try:
-                self._write_run_row(self._current_csv_path, self._run_start_ts, completion_ts)
-            except Exception as exc:
-                self._append_result(f"  CSV write failed: {exc}", "ERROR")
+        # Build the CSV rows now, while _tests and _run_entries are stable
+        # (a loop restart replaces them), and write them on the I/O thread
+        if self._run_entries:
+            log_row = self._run_log_row(completion_ts)
+            wide_row = None
+            if self._current_csv_path and self._run_start_ts:
+                wide_row = self._wide_run_row(self._run_start_ts, completion_ts)
+            self._submit_io(
+                self._write_run_csvs,
+                self._config.effective_log_dir(), log_row,
+                self._current_csv_path, wide_row,
+            )
 
         # Restart the same run if loop mode is active and Stop was not pressed
         if self._loop_var.get() and not self._stop_requested:
@@ -874,67 +1305,175 @@ class TestSuitePanel(ttk.Frame):
             return
 
         # Run has ended — next Start should open a fresh CSV
-        self._current_csv_path = None
+        self._end_run_csv()
         self._run_sel_btn.config(state="normal")
         self._run_all_btn.config(state="normal")
         self._stop_btn.config(state="disabled")
 
-    def _append_run_row(self, path, ts: datetime.datetime) -> None:
-        """Append one row to the cumulative CSV log.
+    def _invalidate_csv_headers(self) -> None:
+        self._csv_headers_cache = None
+        self._wide_headers_cache = None
+        self._test_ids_cache = None
+
+    def _build_csv_headers(self) -> None:
+        """Build the CSV header rows and test-ID order once per test-list change."""
+        names = [tc.name for tc in self._tests]
+        self._csv_headers_cache = ["Timestamp", *names]
+        wide = ["Run_Start", "Run_End"]
+        for name in names:
+            wide += (f"{name}_Status", f"{name}_Actual")
+        self._wide_headers_cache = wide
+        self._test_ids_cache = [tc.id for tc in self._tests]
+
+    def _run_log_row(self, ts: datetime.datetime) -> tuple:
+        """Return ``(headers, row)`` for the cumulative CSV log.
 
         Columns: Timestamp, <test1_name>, <test2_name>, …
         A cell is blank when the test was not part of this run.
         """
-        headers = ["Timestamp"] + [tc.name for tc in self._tests]
-        result_lookup = {r.test.id: r.status for r in self._run_results}
-
-        row = [ts.strftime("%Y-%m-%dT%H:%M:%S")]
-        for tc in self._tests:
-            row.append(result_lookup.get(tc.id, ""))
+        if self._test_ids_cache is None:
+            self._build_csv_headers()
+        headers = self._csv_headers_cache
+        result_lookup = {e.result.test.id: e.result.status for e in self._run_entries}
 
-        file_is_new = not path.exists() or path.stat().st_size == 0
-        with open(path, "a", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            if file_is_new:
-                writer.writerow(headers)
-            writer.writerow(row)
+        lookup = result_lookup.get
+        row = [_fmt_ts(ts),
+               *(lookup(tid, "") for tid in self._test_ids_cache)]
+        return headers, row
 
-    def _write_run_row(self, path, run_start: datetime.datetime, run_end: datetime.datetime) -> None:
-        """Append one wide-format row per run/loop iteration.
+    def _wide_run_row(self, run_start: datetime.datetime, run_end: datetime.datetime) -> tuple:
+        """Return ``(headers, row)`` for the per-run CSV, one row per run/loop iteration.
 
         Columns: Run_Start, Run_End, <cmd>_Status, <cmd>_Actual, …
         Tests that were not part of this run (e.g. Run Selected) get blank cells.
         """
-        headers = ["Run_Start", "Run_End"]
-        for tc in self._tests:
-            headers += [f"{tc.name}_Status", f"{tc.name}_Actual"]
+        if self._test_ids_cache is None:
+            self._build_csv_headers()
+        headers = self._wide_headers_cache
+        test_ids = self._test_ids_cache
+        entries = self._run_entries
+
+        row: list = [
+            _fmt_ts(run_start),
+            _fmt_ts(run_end),
+        ]
+        if len(entries) == len(test_ids) and all(
+            e.result.test.id == tid for e, tid in zip(entries, test_ids)
+        ):
+            # Run All: one result per test, already in column order
+            for e in entries:
+                r = e.result
+                row += (r.status, r.actual.replace("\n", " | "))
+            return headers, row
 
         result_lookup = {
-            r.test.id: (r.status, r.actual.replace("\n", " | "))
-            for r in self._run_results
+            e.result.test.id: (e.result.status, e.result.actual.replace("\n", " | "))
+            for e in entries
         }
+        blank = ("", "")
+        lookup = result_lookup.get
+        for tid in test_ids:
+            row += lookup(tid, blank)
+        return headers, row
 
-        row: list = [
-            run_start.strftime("%Y-%m-%dT%H:%M:%S"),
-            run_end.strftime("%Y-%m-%dT%H:%M:%S"),
-        ]
-        for tc in self._tests:
-            if tc.id in result_lookup:
-                status, actual = result_lookup[tc.id]
-                row += [status, actual]
-            else:
-                row += ["", ""]
+    def _write_run_csvs(self, log_dir, log_row: tuple, run_path, wide_row: Optional[tuple]) -> None:
+        """Append a finished run's rows to the CSV files (runs on the I/O thread).
+
+        Status lines are posted to ``_io_notices`` for the Tk thread.
+        """
+        post = self._io_notices.append
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            csv_path = log_dir / "test_suite_log.csv"
+            self._append_csv_row(csv_path, *log_row)
+            post((self._append_result, f"  CSV log → {csv_path}", "header"))
+        except Exception as exc:
+            self._close_csv_file(log_dir / "test_suite_log.csv")
+            post((self._append_result, f"  CSV log failed: {exc}", "ERROR"))
+
+        if wide_row is not None:
+            try:
+                self._append_csv_row(run_path, *wide_row)
+            except Exception as exc:
+                self._close_csv_file(run_path)
+                post((self._append_result, f"  CSV write failed: {exc}", "ERROR"))
+
+    def _append_csv_row(self, path, headers: list, row: list) -> None:
+        """Append *row* to the CSV at *path*, opening it on first use in the run.
 
-        file_is_new = not path.exists() or path.stat().st_size == 0
-        with open(path, "a", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
+        The file stays open for the rest of the run (every loop iteration), so
+        a long loop costs one open and one header check per file rather than
+        one per iteration; each row is flushed so nothing is lost if the app
+        dies mid-run.
+        """
+        fh = self._csv_files.get(path)
+        if fh is None:
+            file_is_new = self._csv_needs_header(path)
+            fh = self._csv_files[path] = _open_csv(path, "a")
             if file_is_new:
-                writer.writerow(headers)
-            writer.writerow(row)
+                fh.write(_csv_line(headers))
+        fh.write(_csv_line(row))
+        fh.flush()
+
+    def _close_csv_file(self, path) -> None:
+        fh = self._csv_files.pop(path, None)
+        if fh is not None:
+            try:
+                fh.close()
+            except OSError:
+                pass
+
+    def _close_csv_files(self) -> None:
+        for path in list(self._csv_files):
+            self._close_csv_file(path)
+
+    def _end_run_csv(self) -> None:
+        """Forget the per-run CSV and close the open CSVs once queued writes are done."""
+        self._current_csv_path = None
+        self._io_pool.submit(self._close_csv_files)
+
+    def _csv_needs_header(self, path) -> bool:
+        """True if *path* is missing or empty.
+
+        Checked on every open, i.e. once per file per run: a CSV deleted or
+        rotated between runs gets its header again.
+        """
+        try:
+            return path.stat().st_size == 0
+        except FileNotFoundError:
+            return True
 
     def _append_result(self, text: str, tag: str = "") -> None:
+        self._append_results([(text, tag)])
+
+    def _append_results(self, lines: List[tuple]) -> None:
+        """Queue ``(text, tag)`` lines for the results log.
+
+        Everything appended before Tk next goes idle is written by one
+        ``_flush_log``, so header, result and CSV lines share a single insert,
+        trim and scroll.
+        """
+        self._pending_log.extend(lines)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.after_idle(self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_id = None
+        lines = self._pending_log
+        if not lines:
+            return
+        self._pending_log = []
+        args = []
+        for text, tag in lines:
+            args.append(text + "\n")
+            args.append(tag if tag else ())
         self._results.config(state="normal")
-        self._results.insert("end", text + "\n", tag if tag else ())
+        self._results.insert("end", *args)
+        self._results_line_count += len(lines)
+        if self._results_line_count > self._results_max_lines + self._results_trim_slack:
+            excess = self._results_line_count - self._results_max_lines
+            self._results.delete("1.0", f"{excess + 1}.0")
+            self._results_line_count = self._results_max_lines
         self._results.config(state="disabled")
         self._results.see("end")
 
@@ -946,29 +1485,35 @@ class TestSuitePanel(ttk.Frame):
         "Timestamp", "Name", "Command", "Expected", "Terminator",
         "Timeout_ms", "Status", "Duration_ms", "Actual_Response",
     ]
+    # None of the headers need quoting, so the encoded row is a plain join
+    _CSV_HEADER_LINE = (",".join(_CSV_HEADERS) + "\r\n").encode("utf-8")
+
+    def _write_csv(self, path, entries: List[_RunEntry],
+                   start_wall: datetime.datetime, start_ns: int) -> None:
+        def _row(e: _RunEntry) -> tuple:
+            r = e.result
+            tc = r.test
+            return (
+                _fmt_ts(_entry_wall_time(e, start_wall, start_ns)),
+                tc.name,
+                tc.command,
+                tc.expected,
+                tc.terminator,
+                tc.timeout_ms,
+                r.status,
+                f"{r.duration_ms:.1f}",
+                r.actual.replace("\n", " | "),
+            )
 
-    def _write_csv(self, path) -> None:
-        with open(path, "w", newline="", encoding="utf-8") as fh:
-            writer = csv.writer(fh)
-            writer.writerow(self._CSV_HEADERS)
-            for i, r in enumerate(self._run_results):
-                ts = (self._run_timestamps[i]
-                      if i < len(self._run_timestamps)
-                      else datetime.datetime.now())
-                writer.writerow([
-                    ts.strftime("%Y-%m-%dT%H:%M:%S"),
-                    r.test.name,
-                    r.test.command,
-                    r.test.expected,
-                    r.test.terminator,
-                    r.test.timeout_ms,
-                    r.status,
-                    f"{r.duration_ms:.1f}",
-                    r.actual.replace("\n", " | "),
-                ])
+        with _open_csv(path, "w") as fh:
+            # Nothing is buffered in the text layer yet, so the header can go
+            # straight to the binary buffer underneath
+            fh.buffer.write(self._CSV_HEADER_LINE)
+            fh.writelines(_csv_line(_row(e)) for e in entries)
 
     def _export_csv(self) -> None:
-        if not self._run_results:
+        from tkinter import filedialog, messagebox
+        if not self._run_entries:
             messagebox.showinfo("Export CSV", "No results to export.")
             return
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -980,32 +1525,63 @@ class TestSuitePanel(ttk.Frame):
         )
         if not path:
             return
+        self._submit_io(
+            self._export_csv_background, path, list(self._run_entries),
+            self._run_start_ts, self._run_start_ns,
+        )
+
+    def _export_csv_background(self, path, entries: List[_RunEntry],
+                               start_wall: datetime.datetime, start_ns: int) -> None:
         try:
-            self._write_csv(path)
+            self._write_csv(path, entries, start_wall, start_ns)
         except OSError as exc:
-            messagebox.showerror("Export Failed", str(exc))
+            self._io_notices.append((self._show_export_error, str(exc)))
+
+    def _show_export_error(self, text: str) -> None:
+        from tkinter import messagebox
+        messagebox.showerror("Export Failed", text)
 
     def _clear_results(self) -> None:
+        self._pending_log = []
         self._results.config(state="normal")
         self._results.delete("1.0", "end")
         self._results.config(state="disabled")
+        self._results_line_count = 0
         self._summary_var.set("No results yet")
+        # Only rows that show a result need re-rendering
+        shown = list(self._result_map)
         self._result_map.clear()
-        for iid in self._tree.get_children():
-            self._tree.set(iid, "result", "")
-            self._tree.item(iid, tags=())
+        tests_by_id = self._tests_by_id
+        for test_id in shown:
+            tc = tests_by_id.get(test_id)
+            if tc is not None:
+                self._refresh_row(tc)
 
     # ------------------------------------------------------------------ #
     #  Persistence
     # ------------------------------------------------------------------ #
 
     def _save_tests_to_config(self) -> None:
+        """Schedule a save; a burst of toggles/moves is serialised only once."""
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+        self._save_pending_id = self.after(_TESTS_SAVE_DELAY_MS, self._flush_tests_to_config)
+
+    def _flush_pending_save(self) -> None:
+        """Run a scheduled save now, if one is pending."""
+        if self._save_pending_id is not None:
+            self.after_cancel(self._save_pending_id)
+            self._flush_tests_to_config()
+
+    def _flush_tests_to_config(self) -> None:
+        self._save_pending_id = None
         self._config["tests"] = [t.to_dict() for t in self._tests]
         self._config.save()
 
     def _load_tests_from_config(self) -> None:
         raw = self._config.get("tests", [])
         self._tests = [TestCase.from_dict(d) for d in raw if isinstance(d, dict)]
+        self._rebuild_index()
         self._populate_tree()
 
     # ------------------------------------------------------------------ #
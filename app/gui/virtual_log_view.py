@@ -0,0 +1,134 @@
+import itertools
+import tkinter as tk
+from tkinter import font as tkfont
+from tkinter import ttk
+from typing import Deque, Dict, List, Tuple
+
+_WHEEL_LINES = 3  # lines scrolled per mouse-wheel notch
+
+
+class VirtualLogView(ttk.Frame):
+    """Read-only, colour-tagged log view that only draws the visible lines.
+
+    The lines live in a caller-owned deque of ``(text, tag)`` pairs; this
+    widget keeps one Canvas text item per visible row and re-labels them on
+    scroll or ``refresh()``, so render cost depends on the window height, not
+    on how many lines are buffered.  Unlike a Text widget it has no wrapping
+    and no text selection.
+    """
+
+    def __init__(self, parent, lines: Deque[Tuple[str, str]], font,
+                 colors: Dict[str, str], bg: str, fg: str, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._lines = lines
+        self._colors = colors
+        self._fg = fg
+        self._font = tkfont.Font(font=font)
+        self._line_h: int = self._font.metrics("linespace")
+        self._top = 0            # index into _lines of the first visible row
+        self._pinned = True      # follow new lines until the user scrolls up
+        self._items: List[int] = []
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self._canvas = tk.Canvas(self, bg=bg, highlightthickness=0)
+        self._canvas.grid(row=0, column=0, sticky="nsew")
+        self._vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self._vsb.grid(row=0, column=1, sticky="ns")
+
+        self._canvas.bind("<Configure>", self._on_configure)
+        self._canvas.bind("<MouseWheel>", self._on_wheel)     # Windows / macOS
+        self._canvas.bind("<Button-4>", self._on_wheel)       # X11 wheel up
+        self._canvas.bind("<Button-5>", self._on_wheel)       # X11 wheel down
+
+    # ------------------------------------------------------------------ #
+    #  Public API
+    # ------------------------------------------------------------------ #
+
+    def refresh(self, follow: bool = True, evicted: int = 0) -> None:
+        """Redraw after the line buffer changed.
+
+        With *follow* the view jumps to the newest line unless the user has
+        scrolled away from the bottom.  *evicted* is how many lines the
+        change pushed off the left of a full buffer; a scrolled-back view
+        moves up by as much so it keeps showing the same lines.
+        """
+        if follow and self._pinned:
+            self._top = self._max_top()
+        elif evicted:
+            self._top = max(self._top - evicted, 0)
+        self._redraw()
+
+    def clear(self) -> None:
+        self._top = 0
+        self._pinned = True
+        self._redraw()
+
+    # ------------------------------------------------------------------ #
+    #  Scrolling
+    # ------------------------------------------------------------------ #
+
+    def _rows(self) -> int:
+        return max(1, self._canvas.winfo_height() // self._line_h)
+
+    def _max_top(self) -> int:
+        return max(0, len(self._lines) - self._rows())
+
+    def _scroll_to(self, top: int) -> None:
+        max_top = self._max_top()
+        self._top = min(max(top, 0), max_top)
+        self._pinned = self._top >= max_top
+        self._redraw()
+
+    def _on_scrollbar(self, action, amount, unit=None) -> None:
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self._lines)))
+        elif action == "scroll":
+            step = self._rows() if unit == "pages" else 1
+            self._scroll_to(self._top + int(amount) * step)
+
+    def _on_wheel(self, event) -> None:
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._scroll_to(self._top + (-_WHEEL_LINES if up else _WHEEL_LINES))
+
+    def _on_configure(self, _event=None) -> None:
+        self.refresh(follow=True)
+
+    # ------------------------------------------------------------------ #
+    #  Rendering
+    # ------------------------------------------------------------------ #
+
+    def _redraw(self) -> None:
+        rows = self._rows()
+        canvas = self._canvas
+        while len(self._items) < rows:
+            self._items.append(canvas.create_text(
+                4, len(self._items) * self._line_h, anchor="nw",
+                font=self._font, fill=self._fg, text="",
+            ))
+
+        lines = self._lines
+        total = len(lines)
+        self._top = min(self._top, self._max_top())
+        # Indexed rather than islice'd: deque indexing walks from the nearer
+        # end, so the usual pinned-to-bottom view costs O(rows), not
+        # O(max_lines), however many lines are buffered
+        visible = [lines[i] for i in range(self._top, min(self._top + rows, total))]
+        colors = self._colors
+        for item, entry in itertools.zip_longest(self._items, visible):
+            if entry is None:
+                canvas.itemconfigure(item, text="")
+            else:
+                text, tag = entry
+                text = text.rstrip("\n")
+                if "\n" in text:
+                    # One canvas row per entry: a multi-line INFO/ERROR
+                    # message would otherwise overlap the rows below it
+                    text = text.replace("\n", " | ")
+                canvas.itemconfigure(item, text=text,
+                                     fill=colors.get(tag, self._fg))
+
+        if total:
+            self._vsb.set(self._top / total, min(self._top + rows, total) / total)
+        else:
+            self._vsb.set(0.0, 1.0)
@@ -1,17 +1,35 @@
 import pathlib
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from app.serial_handler import TerminalMessage
 
+# Queued by close_session() to tell the writer thread to finish.
+_STOP = None
+
+# The writer flushes after this many lines or this long since the last flush,
+# whichever comes first, rather than after every batch.
+_FLUSH_LINES = 256
+_FLUSH_INTERVAL_S = 0.5
+_FILE_BUFFER = 64 * 1024
+
 
 class SessionLogger:
-    LOG_LINE_FMT = "{timestamp} [{direction:<5s}] {text}\n"
+    """Session log file written by a background thread.
+
+    ``write``/``write_many`` only enqueue messages; formatting and disk I/O
+    happen on the ``session-logger`` thread so slow storage never stalls Tk.
+    """
 
     def __init__(self) -> None:
         self._file = None
         self._path: Optional[pathlib.Path] = None
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
 
     @property
     def is_open(self) -> bool:
@@ -26,30 +44,84 @@ class SessionLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._path = log_dir / f"session_{timestamp}.log"
         self._file = open(
-            self._path, "a", encoding="utf-8", errors="replace", newline=""
+            self._path, "a", encoding="utf-8", errors="replace", newline="",
+            buffering=_FILE_BUFFER,
+        )
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._writer_loop,
+            args=(self._file, self._queue),
+            daemon=True,
+            name="session-logger",
         )
+        self._thread.start()
         return self._path
 
+    def _format(self, msg: TerminalMessage) -> str:
+        # "<iso timestamp> [DIR  ] text\n" — the message already carries the
+        # padded "[DIR  ] text\n" part for the terminal's no-timestamp view
+        return msg.timestamp.isoformat(timespec="milliseconds") + " " + msg.formatted_no_ts
+
     def write(self, msg: TerminalMessage) -> None:
-        if self._file is None:
-            return
-        try:
-            line = self.LOG_LINE_FMT.format(
-                timestamp=msg.timestamp.isoformat(timespec="milliseconds"),
-                direction=msg.direction.value,
-                text=msg.text,
-            )
-            self._file.write(line)
-            self._file.flush()
-        except Exception as exc:
-            print(f"[logger] write failed: {exc}", file=sys.stderr)
+        if self._queue is not None:
+            self._queue.put_nowait((msg,))
 
-    def close_session(self) -> None:
-        if self._file is not None:
+    def write_many(self, messages: Iterable[TerminalMessage]) -> None:
+        """Queue a batch of messages for the writer thread."""
+        if self._queue is not None:
+            self._queue.put_nowait(messages)
+
+    def _writer_loop(self, fh, q: queue.Queue) -> None:
+        unflushed = 0
+        last_flush = time.monotonic()
+        while True:
+            # Block indefinitely only when there is nothing waiting to be
+            # flushed; otherwise wake up in time for the interval flush.
+            timeout = None
+            if unflushed:
+                timeout = max(0.0, last_flush + _FLUSH_INTERVAL_S - time.monotonic())
             try:
-                self._file.flush()
-                self._file.close()
-            except Exception:
+                batches: List[Iterable[TerminalMessage]] = [q.get(timeout=timeout)]
+            except queue.Empty:
+                batches = []
+            try:
+                while True:
+                    batches.append(q.get_nowait())
+            except queue.Empty:
                 pass
-            self._file = None
-            self._path = None
+
+            stop = _STOP in batches
+            try:
+                lines = [
+                    self._format(msg)
+                    for batch in batches if batch is not _STOP
+                    for msg in batch
+                ]
+                fh.writelines(lines)
+                unflushed += len(lines)
+                now = time.monotonic()
+                if unflushed and (unflushed >= _FLUSH_LINES
+                                  or now - last_flush >= _FLUSH_INTERVAL_S):
+                    fh.flush()
+                    unflushed = 0
+                    last_flush = now
+            except Exception as exc:
+                print(f"[logger] write failed: {exc}", file=sys.stderr)
+            if stop:
+                # The file belongs to this thread: close_session() never
+                # closes it, even if its join times out mid-write
+                try:
+                    fh.close()
+                except Exception as exc:
+                    print(f"[logger] close failed: {exc}", file=sys.stderr)
+                return
+
+    def close_session(self) -> None:
+        """Stop the writer thread, which writes what is queued and closes the file."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout=2.0)
+            self._thread = None
+            self._queue = None
+        self._file = None
+        self._path = None
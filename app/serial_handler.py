@@ -1,32 +1,175 @@
+import collections
 import datetime
 import queue
+import re
 import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence
 
+try:
+    import serial
+    from serial import SerialException
+except ImportError:  # the GUI still starts; connect() reports the problem
+    serial = None
 
-class Direction(Enum):
+    class SerialException(Exception):
+        pass
+
+
+# str mixin: members hash and compare as their plain string value, which
+# makes the per-message dict lookups keyed on direction cheaper than
+# Enum.__hash__.
+class Direction(str, Enum):
     TX    = "TX"
     RX    = "RX"
     INFO  = "INFO"
     ERROR = "ERROR"
 
 
-@dataclass(frozen=True)
+# Splits decoded RX text into lines, dropping the "\r"s before each "\n" —
+# the same result as rstrip(b"\r") on every line, in one C-level call
+_split_rx_lines = re.compile(r"\r*\n").split
+
+# "[TX   ] "-style display prefixes, padded once rather than per message
+_DIR_PREFIX = {d: f"[{d.value:<5s}] " for d in Direction}
+
+
+# slots=True: no per-instance __dict__ — one of these is created for every
+# line received.
+@dataclass(frozen=True, slots=True)
 class TerminalMessage:
     direction: Direction
     text: str
     timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
+    # Terminal display lines, built by whichever thread creates the message
+    # (the reader thread for RX) so the Tk thread only has to insert them.
+    formatted_ts: str = field(init=False, repr=False, compare=False)
+    formatted_no_ts: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ts = self.timestamp
+        no_ts = _DIR_PREFIX[self.direction] + self.text + "\n"
+        object.__setattr__(self, "formatted_no_ts", no_ts)
+        object.__setattr__(
+            self, "formatted_ts",
+            f"[{ts.hour:02d}:{ts.minute:02d}:{ts.second:02d}."
+            f"{ts.microsecond // 1000:03d}] " + no_ts,
+        )
+
+
+class MessageQueue:
+    """FIFO of TerminalMessages that the GUI drains in bulk.
+
+    There are several producers (reader thread, GUI TX echo, test runner) but
+    exactly one consumer, the Tk poll loop.  ``deque.append`` and
+    ``deque.popleft`` are atomic, so neither side needs a lock: the consumer
+    only ever pops messages that were already there when it sampled ``len``.
+    """
+
+    def __init__(self) -> None:
+        self._items: collections.deque = collections.deque()
+        self.put = self._items.append
+        # Queue a whole batch in one call, e.g. every line of one read()
+        self.put_many = self._items.extend
+
+    def drain(self, max_n: int) -> Sequence[TerminalMessage]:
+        """Remove and return up to *max_n* messages, oldest first.
+
+        An empty queue returns a shared empty tuple, so idle poll ticks
+        allocate nothing.
+        """
+        items = self._items
+        n = min(max_n, len(items))
+        if not n:
+            return ()
+        popleft = items.popleft
+        return [popleft() for _ in range(n)]
+
+
+class CaptureQueue:
+    """Copy of the RX stream for the test runner, with a blocking ``get``.
+
+    Like ``MessageQueue`` it is a plain deque with one producer (the reader
+    thread) and one consumer (the runner thread), so ``put`` costs an append
+    plus an ``Event.set`` only when ``get`` has cleared the event to wait.
+    ``get`` and ``get_nowait`` raise ``queue.Empty`` like ``queue.Queue``.
+    """
+
+    def __init__(self) -> None:
+        self._items: collections.deque = collections.deque()
+        self._ready = threading.Event()
 
+    def put(self, msg: TerminalMessage) -> None:
+        self._items.append(msg)
+        if not self._ready.is_set():
+            self._ready.set()
 
-def list_serial_ports() -> list:
-    """Return list of (device, description) tuples for available serial ports."""
+    def put_many(self, msgs: Sequence[TerminalMessage]) -> None:
+        self._items.extend(msgs)
+        if not self._ready.is_set():
+            self._ready.set()
+
+    def get_nowait(self) -> TerminalMessage:
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get(self, timeout: Optional[float] = None) -> TerminalMessage:
+        items = self._items
+        if items:
+            return items.popleft()
+        # Clear, then re-check: a put() that lands after the check sees the
+        # event cleared and sets it, so the wait below cannot miss it
+        self._ready.clear()
+        if items:
+            return items.popleft()
+        if not self._ready.wait(timeout):
+            raise queue.Empty
+        return items.popleft()
+
+    def get_many(self, timeout: Optional[float] = None) -> list:
+        """Wait like ``get`` for one message, then also take any already queued.
+
+        A burst of lines then costs one timed wait instead of one per line.
+        """
+        batch = [self.get(timeout)]
+        items = self._items
+        n = len(items)
+        if n:
+            popleft = items.popleft
+            batch.extend([popleft() for _ in range(n)])
+        return batch
+
+
+# (monotonic time, ports) of the last enumeration; replaced, never mutated
+_ports_cache: tuple = (float("-inf"), [])
+
+
+def list_serial_ports(max_age_s: float = 0.0) -> list:
+    """Return list of (device, description) tuples for available serial ports.
+
+    Enumeration can take hundreds of milliseconds, so a result younger than
+    *max_age_s* seconds is reused.  The default always re-scans.
+    """
+    global _ports_cache
+    scanned_at, ports = _ports_cache
+    if time.monotonic() - scanned_at < max_age_s:
+        return list(ports)
     try:
         from serial.tools.list_ports import comports
-        return [(p.device, p.description or p.device) for p in sorted(comports())]
+        ports = [(p.device, p.description or p.device) for p in sorted(comports())]
     except Exception:
-        return []
+        ports = []
+    _ports_cache = (time.monotonic(), ports)
+    return list(ports)
+
+
+# Read timeout of the port.  The reader blocks in the kernel for up to this
+# long when the line is idle; disconnect() interrupts it with cancel_read().
+_READ_TIMEOUT_S = 0.5
 
 
 class SerialHandler:
@@ -34,11 +177,14 @@ class SerialHandler:
         self._serial = None
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._rx_queue: queue.Queue = queue.Queue()
-        self._capture_queue: Optional[queue.Queue] = None
+        self._rx_queue = MessageQueue()
+        self._capture_queue: Optional[CaptureQueue] = None
+        # Set by the reader thread alongside queueing an ERROR message, so the
+        # GUI can check one flag instead of scanning every drained message.
+        self._error_pending = False
 
     @property
-    def rx_queue(self) -> queue.Queue:
+    def rx_queue(self) -> MessageQueue:
         return self._rx_queue
 
     @property
@@ -47,18 +193,20 @@ class SerialHandler:
 
     def connect(self, port: str, baud: int, parity: str,
                 databits: int, stopbits: float) -> None:
-        import serial
+        if serial is None:
+            raise RuntimeError("pyserial is not installed")
         self._serial = serial.Serial(
             port=port,
             baudrate=baud,
             bytesize=databits,
             parity=parity,
             stopbits=stopbits,
-            timeout=0.1,
+            timeout=_READ_TIMEOUT_S,
             rtscts=False,
             dsrdtr=False,
         )
         self._stop_event.clear()
+        self._error_pending = False
         self._thread = threading.Thread(
             target=self._read_loop,
             daemon=True,
@@ -69,6 +217,12 @@ class SerialHandler:
     def disconnect(self) -> None:
         self._stop_event.set()
         if self._thread is not None:
+            try:
+                # Wake the reader from its blocking read rather than waiting
+                # out the timeout
+                self._serial.cancel_read()
+            except Exception:
+                pass
             self._thread.join(timeout=2.0)
             self._thread = None
         if self._serial is not None:
@@ -80,44 +234,75 @@ class SerialHandler:
         self._capture_queue = None
 
     def send(self, text: str, line_ending: bytes) -> None:
-        import serial
         if self._serial is None or not self._serial.is_open:
-            raise serial.SerialException("Not connected")
+            raise SerialException("Not connected")
         self._serial.write(text.encode("utf-8") + line_ending)
 
+    @property
+    def error_pending(self) -> bool:
+        return self._error_pending
+
+    def queue_error(self, text: str) -> None:
+        """Queue an ERROR message and flag it for the GUI's disconnect check.
+
+        The flag is set after the message is queued, so a consumer that sees
+        it and then empties the queue has also drained the message.
+        """
+        self._rx_queue.put(TerminalMessage(Direction.ERROR, text))
+        self._error_pending = True
+
+    def take_error_pending(self) -> bool:
+        """Return True (once) if an ERROR message has been queued by queue_error."""
+        if self._error_pending:
+            self._error_pending = False
+            return True
+        return False
+
     def start_capture(self) -> None:
-        self._capture_queue = queue.Queue()
+        self._capture_queue = CaptureQueue()
 
     def stop_capture(self) -> None:
         self._capture_queue = None
 
-    def get_capture_queue(self) -> Optional[queue.Queue]:
+    def get_capture_queue(self) -> Optional[CaptureQueue]:
         return self._capture_queue
 
     def _read_loop(self) -> None:
-        import serial
         buf = bytearray()
+        port = self._serial
         while not self._stop_event.is_set():
             try:
-                chunk = self._serial.read(self._serial.in_waiting or 1)
+                # Block for the first byte, then take whatever else has
+                # arrived: an idle line costs no in_waiting ioctl per wake-up
+                chunk = port.read(1)
                 if chunk:
+                    old_len = len(buf)
                     buf.extend(chunk)
-                    lines = buf.split(b"\n")
-                    buf = lines.pop()
-                    for raw_line in lines:
-                        text = raw_line.rstrip(b"\r").decode("utf-8", errors="replace")
-                        msg = TerminalMessage(Direction.RX, text)
-                        self._rx_queue.put(msg)
-                        cq = self._capture_queue
-                        if cq is not None:
-                            cq.put(msg)
-            except serial.SerialException as exc:
-                err = TerminalMessage(Direction.ERROR, f"Port error: {exc}")
-                self._rx_queue.put(err)
+                    waiting = port.in_waiting
+                    if waiting:
+                        buf.extend(port.read(waiting))
+                    # Only the new bytes can hold a newline, and only the
+                    # complete lines before it are split: a partial line that
+                    # is still arriving is not rescanned on every chunk
+                    end = buf.rfind(b"\n", old_len)
+                    if end < 0:
+                        continue
+                    # Decode all complete lines at once; a newline byte can
+                    # never be part of a multi-byte sequence, so this matches
+                    # decoding line by line
+                    lines = _split_rx_lines(buf[:end + 1].decode("utf-8", errors="replace"))
+                    lines.pop()     # the empty string after the final "\n"
+                    del buf[:end + 1]
+                    msgs = [TerminalMessage(Direction.RX, text) for text in lines]
+                    self._rx_queue.put_many(msgs)
+                    cq = self._capture_queue
+                    if cq is not None:
+                        cq.put_many(msgs)
+            except SerialException as exc:
+                self.queue_error(f"Port error: {exc}")
                 self._stop_event.set()
                 break
             except Exception as exc:
-                err = TerminalMessage(Direction.ERROR, f"Read error: {exc}")
-                self._rx_queue.put(err)
+                self.queue_error(f"Read error: {exc}")
                 self._stop_event.set()
                 break
@@ -1,3 +1,5 @@
+import functools
+import operator
 import queue
 import re
 import threading
@@ -15,10 +17,19 @@ _ESCAPE_SEQUENCES: dict = {
 }
 
 
+# All tokens in one alternation, so expansion is a single pass over the command
+_ESCAPE_SUB = re.compile("|".join(map(re.escape, _ESCAPE_SEQUENCES))).sub
+
+
+def _escape_replacement(m: "re.Match") -> str:
+    return _ESCAPE_SEQUENCES[m.group()]
+
+
 def _expand_escapes(cmd: str) -> str:
-    for token, replacement in _ESCAPE_SEQUENCES.items():
-        cmd = cmd.replace(token, replacement)
-    return cmd
+    # Every token starts with "<"; plain commands skip the regex entirely
+    if "<" not in cmd:
+        return cmd
+    return _ESCAPE_SUB(_escape_replacement, cmd)
 
 
 # Matches lines of the form:  <optional prefix>  <op>  <threshold>
@@ -28,6 +39,73 @@ _CHECK_RE = re.compile(r'^(.*?)\s*(>=|<=|!=|==|>|<|in)\s+(.+)$')
 _NUMBER_RE = re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
 
 
+# Comparison for each <op> of a "<prefix> <op> <value>" check
+_OPS: dict = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">":  operator.gt,
+    "<":  operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _NumericCheck:
+    """One parsed line of ``TestCase.numeric_checks``.
+
+    Problems with the line are kept as messages rather than raised, and are
+    reported at the same point of the evaluation as before parsing was
+    cached: *syntax_error* straight away, *operand_error* only once the
+    number has been found in the response.
+    """
+    syntax_error: Optional[str] = None
+    prefix: str = ""
+    op: str = ""
+    # float threshold, or (lo, hi) for "in"
+    operand: object = None
+    operand_error: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_checks(checks_str: str) -> Tuple[_NumericCheck, ...]:
+    """Parse *checks_str* once; repeated runs of a test reuse the result."""
+    compiled: List[_NumericCheck] = []
+    for raw in checks_str.split("\n"):
+        line = raw.strip()
+        if not line:
+            continue
+
+        m = _CHECK_RE.match(line)
+        if not m:
+            compiled.append(_NumericCheck(syntax_error=f"Bad syntax: {line!r}"))
+            continue
+
+        prefix = m.group(1).strip()
+        op     = m.group(2)
+        rhs    = m.group(3).strip()
+
+        operand: object = None
+        operand_error: Optional[str] = None
+        if op == "in":
+            parts = rhs.split("..")
+            if len(parts) != 2:
+                operand_error = f"Bad range (expected lo..hi): {rhs!r}"
+            else:
+                try:
+                    operand = (float(parts[0].strip()), float(parts[1].strip()))
+                except ValueError:
+                    operand_error = f"Non-numeric range bounds: {rhs!r}"
+        else:
+            try:
+                operand = float(rhs)
+            except ValueError:
+                operand_error = f"Non-numeric threshold: {rhs!r}"
+
+        compiled.append(_NumericCheck(None, prefix, op, operand, operand_error))
+    return tuple(compiled)
+
+
 def _evaluate_numeric_checks(checks_str: str, actual: str) -> Tuple[bool, List[str]]:
     """Evaluate newline-separated numeric assertions against *actual*.
 
@@ -42,76 +120,59 @@ def _evaluate_numeric_checks(checks_str: str, actual: str) -> Tuple[bool, List[s
 
     Returns ``(all_passed, failure_messages)``.
     """
-    if not checks_str.strip():
+    checks = _compile_checks(checks_str)
+    if not checks:
         return True, []
 
     failures: List[str] = []
-    for raw in checks_str.split("\n"):
-        line = raw.strip()
-        if not line:
-            continue
-
-        m = _CHECK_RE.match(line)
-        if not m:
-            failures.append(f"Bad syntax: {line!r}")
+    fail = failures.append
+    num_search = _NUMBER_RE.search
+    find = actual.find
+    for check in checks:
+        if check.syntax_error is not None:
+            fail(check.syntax_error)
             continue
 
-        prefix = m.group(1).strip()
-        op     = m.group(2)
-        rhs    = m.group(3).strip()
+        prefix = check.prefix
 
-        # Locate search region
-        search_in = actual
+        # Locate search region: the number must follow the prefix.  The
+        # regex starts at an offset instead of searching a sliced copy.
+        start = 0
         if prefix:
-            idx = actual.find(prefix)
+            idx = find(prefix)
             if idx == -1:
-                failures.append(f"Prefix not found: {prefix!r}")
+                fail(f"Prefix not found: {prefix!r}")
                 continue
-            search_in = actual[idx + len(prefix):]
+            start = idx + len(prefix)
 
-        num_m = _NUMBER_RE.search(search_in)
+        num_m = num_search(actual, start)
         if not num_m:
             loc = f"after {prefix!r}" if prefix else "in response"
-            failures.append(f"No number {loc}")
+            fail(f"No number {loc}")
             continue
 
         value = float(num_m.group())
 
+        if check.operand_error is not None:
+            fail(check.operand_error)
+            continue
+
+        op = check.op
         if op == "in":
-            parts = rhs.split("..")
-            if len(parts) != 2:
-                failures.append(f"Bad range (expected lo..hi): {rhs!r}")
-                continue
-            try:
-                lo, hi = float(parts[0].strip()), float(parts[1].strip())
-            except ValueError:
-                failures.append(f"Non-numeric range bounds: {rhs!r}")
-                continue
+            lo, hi = check.operand
             if not (lo <= value <= hi):
                 loc = f" (after {prefix!r})" if prefix else ""
-                failures.append(f"{value} not in [{lo}..{hi}]{loc}")
+                fail(f"{value} not in [{lo}..{hi}]{loc}")
         else:
-            try:
-                threshold = float(rhs)
-            except ValueError:
-                failures.append(f"Non-numeric threshold: {rhs!r}")
-                continue
-            result = {
-                ">=": value >= threshold,
-                "<=": value <= threshold,
-                ">":  value > threshold,
-                "<":  value < threshold,
-                "==": value == threshold,
-                "!=": value != threshold,
-            }[op]
-            if not result:
+            threshold = check.operand
+            if not _OPS[op](value, threshold):
                 loc = f" (after {prefix!r})" if prefix else ""
-                failures.append(f"{value} {op} {threshold} failed{loc}")
+                fail(f"{value} {op} {threshold} failed{loc}")
 
     return len(failures) == 0, failures
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     name: str
     command: str
@@ -135,6 +196,36 @@ class TestCase:
     # When to fire: "before_setup" (default) or "after_setup"
     trigger_timing: str = "before_setup"
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Treeview cells derived from the fields above, cached by the GUI; reset
+    # to None whenever a displayed field changes.
+    _row_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # (expected, display form) — recomputed when ``expected`` is reassigned
+    _expected_display: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # (expected, parsed patterns), same invalidation as _expected_display
+    _expected_patterns: Optional[Tuple[str, Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def expected_display(self) -> str:
+        """``expected`` on one line, patterns joined with " ∧ "."""
+        cached = self._expected_display
+        if cached is None or cached[0] is not self.expected:
+            cached = self._expected_display = (
+                self.expected, self.expected.replace("\n", " ∧ ")
+            )
+        return cached[1]
+
+    @property
+    def expected_patterns(self) -> Tuple[str, ...]:
+        """Non-blank, stripped lines of ``expected``; each must appear in the response."""
+        cached = self._expected_patterns
+        if cached is None or cached[0] is not self.expected:
+            patterns = tuple(p for p in (ln.strip() for ln in self.expected.split("\n")) if p)
+            cached = self._expected_patterns = (self.expected, patterns)
+        return cached[1]
 
     def to_dict(self) -> dict:
         return {
@@ -174,7 +265,7 @@ class TestCase:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     test: TestCase
     status: str          # "PASS" | "FAIL" | "TIMEOUT" | "ERROR"
@@ -222,6 +313,8 @@ class TestRunner:
 
     def stop(self) -> None:
         self._stop_event.set()
+        # Also wake a runner blocked waiting for a manual verdict
+        self._manual_event.set()
 
     def _run_loop(
         self,
@@ -274,39 +367,55 @@ class TestRunner:
 
     def _execute_silent(
         self,
-        cmd: str,
+        cmds: List[str],
         handler: SerialHandler,
         line_ending: bytes,
         terminator: str,
         timeout_ms: int,
     ) -> None:
-        """Send a navigation command without touching rx_queue.
+        """Send navigation commands in order without touching rx_queue.
 
-        Because nothing is put into rx_queue, the command and its response
-        never reach the terminal display or the session log.
+        Because nothing is put into rx_queue, the commands and their responses
+        never reach the terminal display or the session log.  One capture
+        session covers the whole sequence; anything left over from one
+        command is discarded before the next is sent.
         """
+        cmds = [c.strip() for c in cmds if c.strip()]
+        if not cmds:
+            return
+
         handler.start_capture()
         cq = handler.get_capture_queue()
+        monotonic = time.monotonic
+        cq_get_many = cq.get_many
+        cq_get_nowait = cq.get_nowait
+        timeout_s = timeout_ms / 1000.0
         try:
-            handler.send(_expand_escapes(cmd), line_ending)
-        except Exception:
+            for cmd in cmds:
+                try:
+                    while True:
+                        cq_get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    handler.send(_expand_escapes(cmd), line_ending)
+                except Exception:
+                    continue
+
+                deadline = monotonic() + timeout_s
+                done = False
+                while not done:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch = cq_get_many(timeout=remaining)
+                    except queue.Empty:
+                        continue
+                    if terminator:
+                        done = any(terminator in msg.text for msg in batch)
+        finally:
             handler.stop_capture()
-            return
-
-        timeout_s = timeout_ms / 1000.0
-        t_start = time.monotonic()
-        while True:
-            elapsed = time.monotonic() - t_start
-            if elapsed >= timeout_s:
-                break
-            try:
-                msg = cq.get(timeout=min(timeout_s - elapsed, 0.05))
-                if terminator and terminator in msg.text:
-                    break
-            except queue.Empty:
-                pass
-
-        handler.stop_capture()
 
     def _execute_manual(
         self,
@@ -323,10 +432,8 @@ class TestRunner:
                 handler.rx_queue.put(TerminalMessage(Direction.TX, test.command))
                 handler.send(test.command, line_ending)
             except Exception as exc:
-                for cmd in test.teardown_commands:
-                    if cmd.strip():
-                        self._execute_silent(cmd.strip(), handler, line_ending,
-                                             test.terminator, test.nav_timeout_ms)
+                self._execute_silent(test.teardown_commands, handler, line_ending,
+                                     test.terminator, test.nav_timeout_ms)
                 return TestResult(test=test, status="ERROR",
                                   actual=f"Send failed: {exc}",
                                   duration_ms=(time.monotonic() - t_start) * 1000.0)
@@ -337,25 +444,24 @@ class TestRunner:
         if on_manual_input is not None:
             on_manual_input(test)
 
-        # Block until the user submits, or the run is stopped.
-        while not self._manual_event.is_set():
-            if self._stop_event.is_set():
-                for cmd in test.teardown_commands:
-                    if cmd.strip():
-                        self._execute_silent(cmd.strip(), handler, line_ending,
-                                             test.terminator, test.nav_timeout_ms)
-                return TestResult(test=test, status="ERROR",
-                                  actual="Run stopped while waiting for manual verdict",
-                                  duration_ms=(time.monotonic() - t_start) * 1000.0)
-            time.sleep(0.05)
+        # Block until the user submits, or the run is stopped: stop() sets
+        # _manual_event too.  The stop flag is checked after clear() above,
+        # so a stop that came earlier is not lost; a verdict that is already
+        # in wins over a later stop.
+        if not self._stop_event.is_set():
+            self._manual_event.wait()
+        if self._manual_result is None and self._stop_event.is_set():
+            self._execute_silent(test.teardown_commands, handler, line_ending,
+                                 test.terminator, test.nav_timeout_ms)
+            return TestResult(test=test, status="ERROR",
+                              actual="Run stopped while waiting for manual verdict",
+                              duration_ms=(time.monotonic() - t_start) * 1000.0)
 
         duration_ms = (time.monotonic() - t_start) * 1000.0
         status, actual = self._manual_result or ("ERROR", "No result provided")
 
-        for cmd in test.teardown_commands:
-            if cmd.strip():
-                self._execute_silent(cmd.strip(), handler, line_ending,
-                                     test.terminator, test.nav_timeout_ms)
+        self._execute_silent(test.teardown_commands, handler, line_ending,
+                             test.terminator, test.nav_timeout_ms)
 
         return TestResult(test=test, status=status, actual=actual, duration_ms=duration_ms)
 
@@ -380,12 +486,8 @@ class TestRunner:
             self._run_trigger_commands(test, trigger_handler, line_ending)
 
         # --- Silent setup (menu navigation) ---
-        for cmd in test.setup_commands:
-            if cmd.strip():
-                self._execute_silent(
-                    cmd.strip(), handler, line_ending,
-                    test.terminator, test.nav_timeout_ms,
-                )
+        self._execute_silent(test.setup_commands, handler, line_ending,
+                             test.terminator, test.nav_timeout_ms)
 
         # --- Trigger commands (after setup, if configured) ---
         if test.trigger_timing == "after_setup":
@@ -408,12 +510,8 @@ class TestRunner:
         except Exception as exc:
             handler.stop_capture()
             # Still run teardown before returning
-            for cmd in test.teardown_commands:
-                if cmd.strip():
-                    self._execute_silent(
-                        cmd.strip(), handler, line_ending,
-                        test.terminator, test.nav_timeout_ms,
-                    )
+            self._execute_silent(test.teardown_commands, handler, line_ending,
+                                 test.terminator, test.nav_timeout_ms)
             return TestResult(
                 test=test,
                 status="ERROR",
@@ -421,23 +519,27 @@ class TestRunner:
                 duration_ms=0.0,
             )
 
-        timeout_s = test.timeout_ms / 1000.0
+        terminator = test.terminator
         terminator_found = False
+        monotonic = time.monotonic
+        cq_get_many = cq.get_many
+        collect = collected_lines.append
+        deadline = t_start + test.timeout_ms / 1000.0
 
-        while True:
-            elapsed = time.monotonic() - t_start
-            remaining = timeout_s - elapsed
+        while not terminator_found:
+            remaining = deadline - monotonic()
             if remaining <= 0:
                 break
 
             try:
-                msg = cq.get(timeout=min(remaining, 0.05))
-                collected_lines.append(msg.text)
-                if test.terminator and test.terminator in msg.text:
-                    terminator_found = True
-                    break
+                batch = cq_get_many(timeout=remaining)
             except queue.Empty:
-                if time.monotonic() - t_start >= timeout_s:
+                continue
+            for msg in batch:
+                text = msg.text
+                collect(text)
+                if terminator and terminator in text:
+                    terminator_found = True
                     break
 
         handler.stop_capture()
@@ -449,8 +551,7 @@ class TestRunner:
         else:
             # Substring pattern check
             if test.expected:
-                patterns = [p.strip() for p in test.expected.split("\n") if p.strip()]
-                sub_ok = all(p in actual for p in patterns)
+                sub_ok = all(p in actual for p in test.expected_patterns)
             else:
                 sub_ok = True
 
@@ -465,11 +566,7 @@ class TestRunner:
             status = "PASS" if (sub_ok and num_ok) else "FAIL"
 
         # --- Silent teardown (return to parent menu) ---
-        for cmd in test.teardown_commands:
-            if cmd.strip():
-                self._execute_silent(
-                    cmd.strip(), handler, line_ending,
-                    test.terminator, test.nav_timeout_ms,
-                )
+        self._execute_silent(test.teardown_commands, handler, line_ending,
+                             test.terminator, test.nav_timeout_ms)
 
         return TestResult(test=test, status=status, actual=actual, duration_ms=duration_ms)